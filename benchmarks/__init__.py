@@ -0,0 +1,3 @@
+from .scenarios import BUDGETS, SCENARIOS, Result, over_budget, run_all
+
+__all__ = ["BUDGETS", "SCENARIOS", "Result", "over_budget", "run_all"]
@@ -0,0 +1,96 @@
+import argparse
+import json
+import platform
+import sys
+from dataclasses import asdict
+from typing import Any
+
+from .scenarios import SCENARIOS, Result, over_budget, run_all
+
+
+def to_json(results: list[Result]) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(
+    results: list[Result],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """
+    Return one line per metric that got worse by more than ``tolerance``:
+    above ``old * (1 + tolerance)``, or below ``old / (1 + tolerance)`` for
+    metrics where higher is better.
+    """
+    previous = {entry["name"]: entry["value"] for entry in baseline["results"]}
+    regressions: list[str] = []
+    for result in results:
+        old = previous.get(result.name)
+        if old is None or old <= 0:
+            continue
+        ratio = result.value / old
+        if result.higher_is_better:
+            worse = ratio < 1 / (1 + tolerance)
+        else:
+            worse = ratio > 1 + tolerance
+        if worse:
+            regressions.append(
+                f"{result.name}: {old:.4g} -> {result.value:.4g} {result.unit}"
+                f" ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark both bar backends and emit JSON results.",
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help=f"scenarios to run, any of {', '.join(SCENARIOS)} (default: all)",
+    )
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("-b", "--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown before a metric counts as a regression",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = run_all(args.scenarios or None)
+    payload = json.dumps(to_json(results), indent=2)
+    if args.output:
+        with open(args.output, "w") as out:
+            out.write(payload + "\n")
+    else:
+        print(payload)
+
+    failed = False
+    for line in over_budget(results):
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+        failed = True
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
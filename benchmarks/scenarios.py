@@ -0,0 +1,277 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from timeit import Timer
+from typing import Callable, Iterable, Iterator, Sequence
+
+from src.bars.backend.bar import BarBackend as ProgressBackend
+from src.bars.backend.style_cache import STYLE_CACHE
+from src.bars.bar_backend import BarBackend as IterationBackend
+from src.bars.delta_renderer import DeltaRenderer
+from src.bars.fast_bar import FastBar
+from src.bars.fast_bar_new_backend import FastBar as FastBarNewBackend
+from src.bars.refresh import RefreshPolicy
+from src.colors.color_array import ColorArray
+from src.colors.color_depth import COLOR_DEPTHS
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.pallete import Pallete, PalleteGenerator
+from src.colors.types import Color, color
+from src.colors.types.color_spaces import Oklch, sRGB
+
+ITERATIONS = 10_000
+WIDTHS = (10, 50, 200)
+REPEAT = 5
+ROOT = Path(__file__).resolve().parent.parent
+
+# Upper limits a result must stay under, checked by ``python -m benchmarks``.
+BUDGETS: dict[str, float] = {
+    "import.fast_bar": 0.04,
+    "import.fast_bar_new_backend": 0.04,
+}
+
+RED = color(sRGB(255, 0, 0))
+GREEN = color(sRGB(0, 255, 0))
+BLUE = color(sRGB(0, 0, 255))
+GRADIENT = Gradient(RED, GREEN, BLUE)
+PALLETE = Pallete(RED, GREEN, BLUE)
+
+
+@dataclass
+class Result:
+    name: str
+    value: float
+    unit: str
+    # Ratios such as cache hit rates regress when they drop, not when they grow.
+    higher_is_better: bool = False
+
+
+def best_of(function: Callable[[], object], number: int = 1) -> float:
+    """Best wall time of ``REPEAT`` runs, divided by ``number`` calls."""
+    return min(Timer(function).repeat(REPEAT, number)) / number
+
+
+def per_iteration_overhead() -> Iterator[Result]:
+    def bare() -> None:
+        for _ in range(ITERATIONS + 1):
+            pass
+
+    generator = GradientGenerator(50, GRADIENT)
+    loops: dict[str, Callable[[], None]] = {
+        "bare_loop": bare,
+        "fast_bar": lambda: _drain(FastBar(ITERATIONS, generator)),
+        "fast_bar_no_speed": lambda: _drain(
+            FastBar(ITERATIONS, generator, update_every=None)
+        ),
+        "fast_bar_refresh": lambda: _drain(
+            FastBar(ITERATIONS, generator, refresh=RefreshPolicy(max_fps=30))
+        ),
+        "fast_bar_background": lambda: _drain(
+            FastBar(ITERATIONS, generator).background(file=StringIO())
+        ),
+        "fast_bar_wrapped": lambda: _drain(
+            FastBar(range(ITERATIONS), generator, file=StringIO())
+        ),
+        "fast_bar_new_backend": lambda: _drain(FastBarNewBackend(ITERATIONS, GRADIENT)),
+        "fast_bar_new_backend_refresh": lambda: _drain(
+            FastBarNewBackend(ITERATIONS, GRADIENT, refresh=RefreshPolicy(max_fps=30))
+        ),
+    }
+    for name, loop in loops.items():
+        yield Result(f"overhead.{name}", best_of(loop) / ITERATIONS, "s")
+
+
+def _drain(iterable: Iterable[object]) -> None:
+    for _ in iterable:
+        pass
+
+
+def _sgr_strings(colors: Sequence[Color]) -> list[str]:
+    return [str(c) for c in colors]
+
+
+def _build_all(backend: IterationBackend) -> list[str]:
+    return [backend._build_visual(i) for i in range(backend.bins + 1)]
+
+
+def _build_cold(width: int) -> ProgressBackend:
+    STYLE_CACHE.clear()
+    return ProgressBackend(GRADIENT, width, frame_cache="eager")
+
+
+def frame_construction() -> Iterator[Result]:
+    for width in WIDTHS:
+        generator = GradientGenerator(width, GRADIENT)
+        yield Result(
+            f"construct.iteration_backend.w{width}",
+            best_of(partial(IterationBackend, ITERATIONS, generator)),
+            "s",
+        )
+        for mode in ("eager", "lazy", "compose", "auto"):
+            yield Result(
+                f"construct.progress_backend_{mode}.w{width}",
+                best_of(partial(ProgressBackend, GRADIENT, width, frame_cache=mode)),
+                "s",
+            )
+        yield Result(
+            f"construct.progress_backend_cold.w{width}",
+            best_of(partial(_build_cold, width)),
+            "s",
+        )
+
+        backend = IterationBackend(ITERATIONS, generator)
+        yield Result(
+            f"frame.iteration_backend.w{width}",
+            best_of(partial(_build_all, backend)) / (backend.bins + 1),
+            "s",
+        )
+
+
+def memory_footprint() -> Iterator[Result]:
+    for width in WIDTHS:
+        for mode in ("eager", "lazy", "compose"):
+            backend = ProgressBackend(GRADIENT, width, frame_cache=mode)
+            for i in range(101):
+                backend(i / 100)
+            yield Result(
+                f"memory.progress_backend_{mode}.w{width}",
+                backend.memory_footprint(),
+                "bytes",
+            )
+
+
+def shared_styles() -> Iterator[Result]:
+    """Memory held by many bars drawn with the same style."""
+    bars = 1000
+    STYLE_CACHE.clear()
+    backends = [ProgressBackend(GRADIENT, 50, frame_cache="eager") for _ in range(bars)]
+    tables = {id(backend.bars): backend.memory_footprint() for backend in backends}
+    info = STYLE_CACHE.info()
+    yield Result("memory.shared_tables.b1000", sum(tables.values()), "bytes")
+    yield Result("styles.hit_ratio.b1000", info.hits / bars, "ratio", True)
+
+
+def color_generation() -> Iterator[Result]:
+    for width in WIDTHS:
+        yield Result(
+            f"colors.gradient.w{width}",
+            best_of(partial(list, GradientGenerator(width, GRADIENT)), 10),
+            "s",
+        )
+        yield Result(
+            f"colors.pallete.w{width}",
+            best_of(partial(list, PalleteGenerator(width, PALLETE)), 10),
+            "s",
+        )
+        yield Result(
+            f"colors.gradient_array.w{width}",
+            best_of(GradientGenerator(width, GRADIENT).to_array, 10),
+            "s",
+        )
+        colors = list(GradientGenerator(width, GRADIENT))
+        yield Result(
+            f"colors.sgr_strings.w{width}",
+            best_of(partial(_sgr_strings, colors), 10),
+            "s",
+        )
+        yield Result(
+            f"colors.gradient_escapes.w{width}",
+            best_of(GradientGenerator(width, GRADIENT).to_array().escapes, 10),
+            "s",
+        )
+        for space in ("linear", "oklab", "oklch"):
+            perceptual = Gradient(RED, GREEN, BLUE, space=space)
+            yield Result(
+                f"colors.gradient_{space}.w{width}",
+                best_of(partial(list, GradientGenerator(width, perceptual)), 10),
+                "s",
+            )
+
+
+def bytes_per_frame() -> Iterator[Result]:
+    for width in WIDTHS:
+        for depth in COLOR_DEPTHS:
+            sized = ProgressBackend(GRADIENT, width, color_depth=depth)
+            frames = sum(len(sized(i / 100).encode()) for i in range(101))
+            yield Result(f"bytes.frame_{depth}.w{width}", frames / 101, "bytes")
+
+        backend = ProgressBackend(GRADIENT, width, color_depth="truecolor")
+        renderer = DeltaRenderer(backend)
+        full = 0
+        delta = 0
+        for i in range(ITERATIONS + 1):
+            progress = i / ITERATIONS
+            counter = f" {i}/{ITERATIONS}"
+            full += len(f"\r\033[2K{backend(progress)}{counter}".encode())
+            delta += len(renderer(progress, counter).encode())
+        yield Result(f"bytes.full_redraw.w{width}", full / (ITERATIONS + 1), "bytes")
+        yield Result(f"bytes.delta.w{width}", delta / (ITERATIONS + 1), "bytes")
+
+
+def conversions() -> Iterator[Result]:
+    count = 1000
+    rows = [(70.0, 0.15, 360 * i / count) for i in range(count)]
+
+    def per_object() -> None:
+        for row in rows:
+            Oklch(*row).to_rgb()
+
+    yield Result("convert.oklch_objects.n1000", best_of(per_object), "s")
+    yield Result(
+        "convert.oklch_batch.n1000",
+        best_of(partial(ColorArray.from_space, Oklch, rows)),
+        "s",
+    )
+
+
+def _import_time(module: str) -> float:
+    """Cumulative ``-X importtime`` of ``module`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    for line in completed.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def import_times() -> Iterator[Result]:
+    for module in ("fast_bar", "fast_bar_new_backend"):
+        seconds = min(_import_time(f"src.bars.{module}") for _ in range(REPEAT))
+        yield Result(f"import.{module}", seconds, "s")
+
+
+SCENARIOS: dict[str, Callable[[], Iterator[Result]]] = {
+    "overhead": per_iteration_overhead,
+    "construct": frame_construction,
+    "memory": memory_footprint,
+    "styles": shared_styles,
+    "colors": color_generation,
+    "convert": conversions,
+    "bytes": bytes_per_frame,
+    "imports": import_times,
+}
+
+
+def run_all(names: list[str] | None = None) -> list[Result]:
+    results: list[Result] = []
+    for name, scenario in SCENARIOS.items():
+        if names is None or name in names:
+            results.extend(scenario())
+    return results
+
+
+def over_budget(results: list[Result]) -> list[str]:
+    """Return one line per result above its entry in ``BUDGETS``."""
+    return [
+        f"{result.name}: {result.value:.4g} {result.unit} > {BUDGETS[result.name]:.4g}"
+        for result in results
+        if result.name in BUDGETS and result.value > BUDGETS[result.name]
+    ]
@@ -0,0 +1,61 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_bar import AsyncBar
+    from .delta_renderer import DeltaRenderer
+    from .estimators import EMAEstimator, Estimator, WindowEstimator
+    from .fast_bar import FastBar
+    from .file_bar import ByteBar, copy_file, open_read
+    from .multi_bar import MultiBar
+    from .process_bar import ProcessBar
+    from .refresh import RefreshPolicy
+    from .sharded import SharedBar
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "AsyncBar": "async_bar",
+    "ByteBar": "file_bar",
+    "DeltaRenderer": "delta_renderer",
+    "EMAEstimator": "estimators",
+    "Estimator": "estimators",
+    "FastBar": "fast_bar",
+    "MultiBar": "multi_bar",
+    "ProcessBar": "process_bar",
+    "RefreshPolicy": "refresh",
+    "SharedBar": "sharded",
+    "WindowEstimator": "estimators",
+    "copy_file": "file_bar",
+    "open_read": "file_bar",
+}
+
+__all__ = [
+    "AsyncBar",
+    "ByteBar",
+    "DeltaRenderer",
+    "EMAEstimator",
+    "Estimator",
+    "FastBar",
+    "MultiBar",
+    "ProcessBar",
+    "RefreshPolicy",
+    "SharedBar",
+    "WindowEstimator",
+    "copy_file",
+    "open_read",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Submodules are imported on first access, so ``from src.bars import
+    # FastBar`` does not also pay for asyncio, multiprocessing or mmap.
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,203 @@
+import asyncio
+import sys
+import threading
+from time import monotonic
+from typing import AsyncIterable, AsyncIterator, Generic, Optional, TextIO, TypeVar
+
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.types import ColorGenerator, color
+from src.colors.types.color_spaces import sRGB
+
+from .bar_backend import BarBackend
+from .estimators import EMAEstimator, Estimator
+from .fast_bar import default_white_bar
+from .stats import format_estimate
+
+T = TypeVar("T")
+
+
+class NonBlockingWriter:
+    """
+    Write frames from the event loop without ever blocking it.
+
+    Frames are handed to a daemon thread that performs the (blocking)
+    writes, so the descriptor's blocking mode is never changed and other
+    users of the terminal are unaffected. While the thread is busy only the
+    newest frame is kept; older ones would be superseded anyway. Before
+    :meth:`open` and after :meth:`close`, writes go straight to the file.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+        self._ready = threading.Condition()
+        self._pending: Optional[str] = None
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+
+    def open(self) -> None:
+        if self._thread is not None:
+            return
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, data: str) -> None:
+        if self._thread is None:
+            self._emit(data)
+            return
+        with self._ready:
+            self._pending = data
+            self._ready.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                while self._pending is None and not self._closing:
+                    self._ready.wait()
+                data, self._pending = self._pending, None
+            if data is None:
+                return
+            self._emit(data)
+
+    def _emit(self, data: str) -> None:
+        self.file.write(data)
+        self.file.flush()
+
+    def close(self, final: str = "") -> None:
+        """
+        Stop the thread once the pending frame is written, then write
+        ``final`` completely. Blocks, so call it off the event loop.
+        """
+        thread = self._thread
+        if thread is not None:
+            with self._ready:
+                self._closing = True
+                self._ready.notify()
+            thread.join()
+            self._thread = None
+        if final:
+            self._emit(final)
+
+
+class AsyncBar(Generic[T]):
+    """
+    Progress bar for asyncio code.
+
+    ``async for item in AsyncBar(source, total)`` yields the items of an
+    async iterable while counting them; :meth:`update` may be called from
+    any task of the same loop. Drawing happens in a background task that
+    refreshes every ``interval`` seconds, never on the awaited items.
+    """
+
+    def __init__(
+        self,
+        iterable: Optional[AsyncIterable[T]] = None,
+        total: Optional[int] = None,
+        generator: Optional[ColorGenerator] = None,
+        interval: float = 0.1,
+        file: Optional[TextIO] = None,
+        estimator: Optional[Estimator] = None,
+    ) -> None:
+        if total is None:
+            try:
+                total = len(iterable)  # type: ignore[arg-type]
+            except TypeError:
+                raise ValueError("total is required for unsized iterables") from None
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if generator is None:
+            generator = default_white_bar()
+        self.iterable = iterable
+        self.backend = BarBackend(total, generator)
+        self.interval = interval
+        self.writer = NonBlockingWriter(sys.stdout if file is None else file)
+        self.count = 0
+        self.last_stats = "0.0it/s | ETA ?:??"
+        self.estimator: Estimator = EMAEstimator() if estimator is None else estimator
+        self.estimator.add(monotonic(), 0)
+        self._last_count = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return self.backend.iterations
+
+    def update(self, n: int = 1) -> None:
+        self.count += n
+
+    def frame(self) -> str:
+        count = min(self.count, self.backend.iterations)
+        if count != self._last_count:
+            self.estimator.add(monotonic(), count)
+            self.last_stats = format_estimate(
+                self.estimator, self.backend.iterations - count
+            )
+            self._last_count = count
+        return f"{self.backend.generate_bar(count)} | {self.last_stats}"
+
+    def paint(self) -> None:
+        self.writer.write(f"\r\033[2K{self.frame()}")
+
+    async def _render_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.paint()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self.writer.open()
+            self._task = asyncio.create_task(self._render_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            # The last frame and the newline must not be superseded.
+            final = f"\r\033[2K{self.frame()}\n"
+            await asyncio.to_thread(self.writer.close, final)
+
+    async def __aenter__(self) -> "AsyncBar[T]":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        if self.iterable is None:
+            raise TypeError("AsyncBar was created without an iterable")
+        await self.start()
+        try:
+            async for item in self.iterable:
+                yield item
+                self.count += 1
+        finally:
+            await self.close()
+
+
+if __name__ == "__main__":
+    red = color(sRGB(255, 0, 0))
+    green = color(sRGB(0, 255, 0))
+    generator = GradientGenerator(40, Gradient(red, green))
+
+    async def pages(count: int) -> AsyncIterator[int]:
+        for page in range(count):
+            await asyncio.sleep(0.005)
+            yield page
+
+    async def crawl(bar: AsyncBar[int], urls: int) -> None:
+        for _ in range(urls):
+            await asyncio.sleep(0.001)
+            bar.update()
+
+    async def main() -> None:
+        async for _ in AsyncBar(pages(300), 300, generator):
+            pass
+
+        async with AsyncBar[int](total=8 * 250, generator=generator) as bar:
+            await asyncio.gather(*(crawl(bar, 250) for _ in range(8)))
+
+    asyncio.run(main())
@@ -1,26 +1,41 @@
+from functools import cached_property
+from sys import getsizeof
 from time import sleep
-from typing import Generic
+from typing import Generic, Literal, Optional, Sequence
 
+from src.colors.color_array import ColorArray
+from src.colors.color_depth import ColorDepth, resolve_color_depth
 from src.colors.gradient import Gradient, GradientGenerator
 from src.colors.pallete import Pallete, PalleteGenerator
 from src.colors.static_color import StaticColorGenerator
 from src.colors.types import Color, ColorType, color
 from src.colors.types.color_spaces import sRGB
 
+from .frame_buffer import FrameBuffer
+from .frame_cache import FrameCache
+from .strategy import (
+    DEFAULT_MEMORY_BUDGET,
+    FrameCacheMode,
+    choose_frame_cache,
+    estimate_frame_bytes,
+)
+from .style_cache import FrameStyle, frame_style
+
 
 def clip01(n: float) -> float:
     return 0.0 if n < 0.0 else 1.0 if n > 1.0 else n
 
 
-PARTIAL_BLOCKS = [" ", "▏", "▎", "▍", "▌", "▋", "▊", "▉", "█"]
-
-
 class BarBackend(Generic[ColorType]):
     def __init__(
         self,
         colors: ColorType | Pallete | Gradient,
         size: int = 50,
         repeat_pallete: bool = False,
+        frame_cache: FrameCacheMode | Literal["auto"] = "auto",
+        cache_budget: Optional[int] = None,
+        expected_frames: Optional[int] = None,
+        color_depth: ColorDepth | Literal["auto"] = "auto",
     ) -> None:
         if isinstance(colors, Pallete):
             generator = PalleteGenerator(size, colors, repeat_pallete)
@@ -34,40 +49,59 @@ class BarBackend(Generic[ColorType]):
         self.size: int = len(generator)
         self.bins: int = 8 * self.size
 
-        self.gradient_colors: list[Color] = list(generator.no_background())
-
-        self.colored_blocks: list[str] = [
-            f"\033[{color}m█" for color in self.gradient_colors
-        ]
+        # Quantized once per style and shared with every identical bar.
+        self.color_depth: ColorDepth = resolve_color_depth(color_depth)
+        self.style: FrameStyle = frame_style(generator, self.color_depth)
+        self.colors: ColorArray = self.style.colors
+        self.colored_blocks: Sequence[str] = self.style.colored_blocks
 
         # Unfilled style
-        self.unfilled_char = "░"
-        self.unfilled_block = "\033[38;2;90;90;90m" + self.unfilled_char
+        self.unfilled_char = self.style.unfilled_char
+        self.unfilled_block = self.style.unfilled_block
+
+        self.buffer: FrameBuffer = self.style.buffer
+
+        if frame_cache == "auto":
+            if cache_budget is None:
+                cache_budget = DEFAULT_MEMORY_BUDGET
+            frame_cache = choose_frame_cache(
+                self.bins,
+                estimate_frame_bytes(self.buffer.filled),
+                expected_frames,
+                cache_budget,
+            )
+        self.frame_cache: FrameCacheMode = frame_cache
+
+        self.bars: tuple[str, ...] | FrameCache | FrameBuffer
+        if frame_cache == "eager":
+            self.bars = self.style.table
+        elif frame_cache == "lazy":
+            self.bars = FrameCache(self._build_visual, cache_budget)
+        elif frame_cache == "compose":
+            self.bars = self.buffer
+        else:
+            raise ValueError(f"unknown frame_cache mode: {frame_cache!r}")
 
-        self.bars = [self._build_visual(i) for i in range(self.bins + 1)]
+    @cached_property
+    def gradient_colors(self) -> list[Color]:
+        """Per-cell ``Color`` objects, built only when first accessed."""
+        return list(self.colors)
 
     def _build_visual(self, filled: int) -> str:
-        if filled <= 0:
-            return self.unfilled_block * self.size + "\033[0m"
-        if filled >= self.bins:
-            return "".join(self.colored_blocks) + "\033[0m"
-
-        actual_filed = filled // 8
-        partial_eights = filled % 8
-
-        revealed = "".join(self.colored_blocks[:actual_filed])
+        return self.buffer.compose(filled)
 
-        if partial_eights > 0:
-            partial = self.colored_blocks[actual_filed].replace(
-                "█", PARTIAL_BLOCKS[partial_eights]
-            )
-            unfilled_count = self.size - actual_filed - 1
-        else:
-            partial = ""
-            unfilled_count = self.size - actual_filed
+    def memory_footprint(self) -> int:
+        """Approximate size in bytes of the frame table and master buffer."""
+        footprint = self.buffer.memory_footprint()
+        if isinstance(self.bars, FrameCache):
+            footprint += self.bars.memory_footprint()
+        elif isinstance(self.bars, tuple):
+            footprint += getsizeof(self.bars)
+            footprint += sum(getsizeof(frame) for frame in self.bars)
+        return footprint
 
-        unfilled = self.unfilled_block * unfilled_count
-        return revealed + partial + unfilled + "\033[0m"
+    def frame(self, filled: int) -> str:
+        return self.bars[min(max(filled, 0), self.bins)]
 
     def __call__(self, progress: float) -> str:
         progress = clip01(progress)
@@ -90,6 +124,8 @@ if __name__ == "__main__":
         BarBackend(
             Pallete(black_on_white, red_on_black, green_on_white), repeat_pallete=True
         ),
+        BarBackend(white, size=200, frame_cache="lazy", cache_budget=64 * 1024),
+        BarBackend(Gradient(red_on_black, green_on_white), frame_cache="compose"),
     ]
 
     for bar in bars:
@@ -97,4 +133,5 @@ if __name__ == "__main__":
             progress = i / MAX_ITER
             print(f"\r\033[2K{bar(progress)}", end="", flush=True)
             sleep(0.01)
+        print(f" {bar.memory_footprint()} bytes")
     print()
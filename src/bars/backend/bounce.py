@@ -0,0 +1,97 @@
+from math import lcm
+from time import sleep
+from typing import Literal, Sequence
+
+from src.colors.color_depth import ColorDepth, reset, resolve_color_depth
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.types import ColorGenerator, color
+from src.colors.types.color_spaces import sRGB
+
+from .frame_buffer import coalesce, split_block
+from .style_cache import frame_style
+
+SPINNER_GLYPHS = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+
+class BounceBackend:
+    """
+    Precomputed animation for progress of unknown length.
+
+    ``"bounce"`` slides a window of ``width`` colored cells back and forth
+    over an unfilled track; ``"spinner"`` cycles a braille spinner through
+    the generator colors. Every frame is built once in ``__init__`` and
+    ``__call__(tick)`` is a single table lookup.
+    """
+
+    def __init__(
+        self,
+        generator: ColorGenerator,
+        width: int = 8,
+        style: Literal["bounce", "spinner"] = "bounce",
+        color_depth: ColorDepth | Literal["auto"] = "auto",
+    ) -> None:
+        if len(generator) <= 0:
+            raise ValueError("size must be >= 1")
+        if width <= 0:
+            raise ValueError("width must be >= 1")
+        self.size: int = len(generator)
+        self.width: int = min(width, self.size)
+
+        self.color_depth: ColorDepth = resolve_color_depth(color_depth)
+        shared = frame_style(generator, self.color_depth)
+        self.colored_blocks: Sequence[str] = shared.colored_blocks
+
+        # Unfilled style
+        self.unfilled_char = shared.unfilled_char
+        self.unfilled_block = shared.unfilled_block
+        self.reset = reset(self.color_depth)
+
+        if style == "bounce":
+            self.frames = self._build_bounce()
+        elif style == "spinner":
+            self.frames = self._build_spinner()
+        else:
+            raise ValueError(f"unknown style: {style!r}")
+
+    def _build_bounce(self) -> list[str]:
+        last = self.size - self.width
+        starts = list(range(last + 1)) + list(range(last - 1, 0, -1))
+        colored = [split_block(block) for block in self.colored_blocks]
+        unfilled = split_block(self.unfilled_block)
+        return [
+            coalesce(
+                [unfilled] * start
+                + colored[start : start + self.width]
+                + [unfilled] * (last - start)
+            )
+            + self.reset
+            for start in starts
+        ]
+
+    def _build_spinner(self) -> list[str]:
+        count = lcm(len(self.colored_blocks), len(SPINNER_GLYPHS))
+        return [
+            split_block(self.colored_blocks[i % len(self.colored_blocks)])[0]
+            + SPINNER_GLYPHS[i % len(SPINNER_GLYPHS)]
+            + self.reset
+            for i in range(count)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __call__(self, tick: int) -> str:
+        return self.frames[tick % len(self.frames)]
+
+
+if __name__ == "__main__":
+    red = color(sRGB(255, 0, 0))
+    blue = color(sRGB(0, 0, 255))
+    generator = GradientGenerator(30, Gradient(red, blue))
+
+    backends = [BounceBackend(generator), BounceBackend(generator, style="spinner")]
+    for backend in backends:
+        for tick in range(120):
+            print(f"\r\033[2K{backend(tick)}", end="", flush=True)
+            sleep(0.02)
+        print()
@@ -0,0 +1,104 @@
+from array import array
+from sys import getsizeof
+from typing import Iterable, Sequence
+
+from src.colors.types import color
+from src.colors.types.color_spaces import sRGB
+
+PARTIAL_BLOCKS = [" ", "▏", "▎", "▍", "▌", "▋", "▊", "▉", "█"]
+RESET = "\033[0m"
+UNFILLED_COLOR = color(sRGB(90, 90, 90))
+
+
+def split_block(block: str) -> tuple[str, str]:
+    """Split a ``"<escape><glyph>"`` block into its escape and glyph."""
+    return block[:-1], block[-1]
+
+
+def coalesce(cells: Iterable[tuple[str, str]], state: str = "") -> str:
+    """
+    Join ``(escape, glyph)`` cells, emitting an escape only when it differs
+    from the current SGR ``state``.
+    """
+    parts: list[str] = []
+    for escape, glyph in cells:
+        if escape != state:
+            parts.append(escape)
+            state = escape
+        parts.append(glyph)
+    return "".join(parts)
+
+
+class FrameBuffer:
+    """
+    Compose bar frames by slicing two prebuilt master strings.
+
+    ``filled`` holds every colored cell and ``unfilled`` every unfilled glyph.
+    ``offsets[i]`` is the index in ``filled`` where cell ``i`` starts, so a
+    frame is a filled prefix slice, at most one partial glyph and an unfilled
+    suffix slice. Memory is O(size) and each frame costs a constant number of
+    joins.
+
+    Both masters are SGR-coalesced: an escape is only emitted where the color
+    changes, so a static bar is one escape followed by its glyphs. The slice
+    of cell ``i`` therefore starts with an escape only when needed, and the
+    unfilled suffix is always preceded by ``unfilled_escape``.
+    """
+
+    def __init__(
+        self, colored_blocks: Sequence[str], unfilled_block: str, reset: str = RESET
+    ) -> None:
+        if len(colored_blocks) <= 0:
+            raise ValueError("size must be >= 1")
+        self.size: int = len(colored_blocks)
+        self.bins: int = 8 * self.size
+
+        self.offsets = array("I", [0])
+        cells: list[str] = []
+        position = 0
+        state = ""
+        for block in colored_blocks:
+            escape, glyph = split_block(block)
+            cell = glyph if escape == state else block
+            state = escape
+            cells.append(cell)
+            position += len(cell)
+            self.offsets.append(position)
+        self.filled: str = "".join(cells)
+
+        self.unfilled_escape, self.unfilled_char = split_block(unfilled_block)
+        self.unfilled: str = self.unfilled_char * self.size
+        self.reset = reset
+
+    def compose(self, filled: int) -> str:
+        if filled <= 0:
+            return self.unfilled_escape + self.unfilled + self.reset
+        if filled >= self.bins:
+            return self.filled + self.reset
+
+        cells, partial_eights = divmod(filled, 8)
+        end = self.offsets[cells]
+        if partial_eights > 0:
+            # A cell slice is "[escape]█": reuse the escape, swap the glyph.
+            partial = (
+                self.filled[end : self.offsets[cells + 1] - 1]
+                + PARTIAL_BLOCKS[partial_eights]
+            )
+            cells += 1
+        else:
+            partial = ""
+
+        return (
+            self.filled[:end]
+            + partial
+            + self.unfilled_escape
+            + self.unfilled[cells:]
+            + self.reset
+        )
+
+    __getitem__ = compose
+
+    def memory_footprint(self) -> int:
+        return (
+            getsizeof(self.filled) + getsizeof(self.unfilled) + getsizeof(self.offsets)
+        )
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from sys import getsizeof
+from typing import Callable, Optional
+
+
+class FrameCache:
+    """
+    Lazily built frame table indexed by filled bins.
+
+    Frames are built on first access. When ``max_bytes`` is set, the least
+    recently used frames are evicted once the cached strings exceed that
+    budget (the most recent frame is always kept).
+    """
+
+    def __init__(
+        self,
+        build: Callable[[int], str],
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be >= 1")
+        self._build = build
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[int, str] = OrderedDict()
+        self.nbytes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, filled: int) -> bool:
+        return filled in self._frames
+
+    def __getitem__(self, filled: int) -> str:
+        frame = self._frames.get(filled)
+        if frame is not None:
+            if self.max_bytes is not None:
+                self._frames.move_to_end(filled)
+            return frame
+
+        frame = self._build(filled)
+        self._frames[filled] = frame
+        self.nbytes += getsizeof(frame)
+        if self.max_bytes is not None:
+            while self.nbytes > self.max_bytes and len(self._frames) > 1:
+                _, evicted = self._frames.popitem(last=False)
+                self.nbytes -= getsizeof(evicted)
+        return frame
+
+    def clear(self) -> None:
+        self._frames.clear()
+        self.nbytes = 0
+
+    def memory_footprint(self) -> int:
+        return getsizeof(self._frames) + self.nbytes
@@ -0,0 +1,50 @@
+from sys import getsizeof
+from typing import Literal, Optional, Protocol, runtime_checkable
+
+FrameCacheMode = Literal["eager", "lazy", "compose"]
+
+DEFAULT_MEMORY_BUDGET = 1 << 20
+
+
+@runtime_checkable
+class FrameBackend(Protocol):
+    """Interface shared by every bar backend."""
+
+    size: int
+    bins: int
+
+    def frame(self, filled: int) -> str: ...
+
+    def __call__(self, progress: float) -> str: ...
+
+    def memory_footprint(self) -> int: ...
+
+
+def choose_frame_cache(
+    bins: int,
+    frame_bytes: int,
+    expected_frames: Optional[int] = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> FrameCacheMode:
+    """
+    Pick how a backend should store its frames.
+
+    - ``"eager"``: the full table fits in ``memory_budget`` and the bar is
+      expected to draw more frames than there are bins, so every frame will
+      be reused.
+    - ``"compose"``: the bar draws at most one frame per bin, so caching
+      would never be hit; frames are sliced from the master buffer.
+    - ``"lazy"``: anything else (wide or long-running bars); frames are
+      cached on first use within ``memory_budget``.
+    """
+    table_bytes = (bins + 1) * frame_bytes
+    if expected_frames is not None and expected_frames <= bins + 1:
+        return "compose"
+    if table_bytes <= memory_budget:
+        return "eager"
+    return "lazy"
+
+
+def estimate_frame_bytes(filled_master: str) -> int:
+    """Size of one frame, estimated from the fully filled master string."""
+    return getsizeof(filled_master)
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from functools import cached_property
+from threading import Lock
+from typing import Callable, Hashable, NamedTuple
+
+from src.colors.color_array import ColorArray
+from src.colors.color_depth import ColorDepth, escape, reset
+from src.colors.types import ColorGenerator
+
+from .frame_buffer import UNFILLED_COLOR, FrameBuffer
+
+DEFAULT_MAX_STYLES = 64
+
+
+class FrameStyle:
+    """
+    Everything a backend derives from its colors, built once per style.
+
+    Instances are shared between bars and must be treated as read-only:
+    ``colored_blocks`` and ``table`` are tuples and ``buffer`` is never
+    mutated after construction.
+    """
+
+    def __init__(
+        self, colors: ColorArray, color_depth: ColorDepth, unfilled_char: str = "░"
+    ) -> None:
+        self.colors = colors
+        self.color_depth: ColorDepth = color_depth
+        self.colored_blocks: tuple[str, ...] = tuple(
+            prefix + "█" for prefix in colors.escapes(color_depth)
+        )
+        self.unfilled_char = unfilled_char
+        self.unfilled_block = escape(UNFILLED_COLOR, color_depth) + unfilled_char
+        self.buffer = FrameBuffer(
+            self.colored_blocks, self.unfilled_block, reset(color_depth)
+        )
+
+    @cached_property
+    def table(self) -> tuple[str, ...]:
+        """Every frame, built on the first eager backend that asks for it."""
+        return tuple(self.buffer.compose(i) for i in range(self.buffer.bins + 1))
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class StyleCache:
+    """
+    Thread-safe LRU of :class:`FrameStyle` keyed by style.
+
+    A thousand bars with the same colors, width and depth then hold one
+    frame table between them instead of one each.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_STYLES) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._styles: OrderedDict[Hashable, FrameStyle] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], FrameStyle]) -> FrameStyle:
+        with self._lock:
+            style = self._styles.get(key)
+            if style is not None:
+                self._styles.move_to_end(key)
+                self.hits += 1
+                return style
+            self.misses += 1
+            style = self._styles[key] = build()
+            if len(self._styles) > self.maxsize:
+                self._styles.popitem(last=False)
+            return style
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._styles
+
+    def clear(self) -> None:
+        with self._lock:
+            self._styles.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._styles))
+
+
+STYLE_CACHE = StyleCache()
+
+
+def frame_style(
+    generator: ColorGenerator,
+    color_depth: ColorDepth,
+    unfilled_char: str = "░",
+    cache: StyleCache = STYLE_CACHE,
+) -> FrameStyle:
+    """Shared style for ``generator``, or a private one if it has no key."""
+
+    # Key on the generator the style is actually built from.
+    foreground = generator.no_background()
+
+    def build() -> FrameStyle:
+        return FrameStyle(foreground.to_array(), color_depth, unfilled_char)
+
+    key = foreground.cache_key()
+    if key is None:
+        return build()
+    return cache.get((key, color_depth, unfilled_char), build)
+
+
+if __name__ == "__main__":
+    from src.colors.gradient import Gradient, GradientGenerator
+    from src.colors.types import color
+    from src.colors.types.color_spaces import sRGB
+
+    red = color(sRGB(255, 0, 0))
+    blue = color(sRGB(0, 0, 255))
+    styles = [
+        frame_style(GradientGenerator(50, Gradient(red, blue)), "truecolor")
+        for _ in range(1000)
+    ]
+    print(f"{len({id(style) for style in styles})} distinct style(s)")
+    print(STYLE_CACHE.info())
@@ -1,33 +1,28 @@
+from functools import cached_property
+from sys import getsizeof
 from time import sleep
-from typing import Iterator
+from typing import Iterator, Literal, Sequence
 
+from src.colors.color_array import ColorArray
+from src.colors.color_depth import ColorDepth, resolve_color_depth
 from src.colors.gradient import Gradient, GradientGenerator
 from src.colors.pallete import Pallete, PalleteGenerator
 from src.colors.static_color import ColorGenerator, StaticColorGenerator
 from src.colors.types import Color, color
 from src.colors.types.color_spaces import sRGB
 
+from .backend.frame_buffer import PARTIAL_BLOCKS, FrameBuffer
+from .backend.style_cache import FrameStyle, frame_style
+
 
 def partial_block(eights: int = 8) -> str:
-    match eights:
-        case 0:
-            return " "
-        case 1:
-            return "▏"
-        case 2:
-            return "▎"
-        case 3:
-            return "▍"
-        case 4:
-            return "▌"
-        case 5:
-            return "▋"
-        case 6:
-            return "▊"
-        case 7:
-            return "▉"
-        case _:
-            return "█"
+    """
+    Block glyph filled to ``eights`` eighths.
+
+    Frames are composed by :class:`FrameBuffer` now; this stays only for
+    API compatibility with code that imported it from here.
+    """
+    return PARTIAL_BLOCKS[eights] if 0 <= eights < 8 else "█"
 
 
 class BarBackend:
@@ -35,24 +30,27 @@ class BarBackend:
         self,
         iterations: int,
         generator: ColorGenerator,
+        color_depth: ColorDepth | Literal["auto"] = "auto",
     ) -> None:
-        if iterations <= 0:
-            raise ValueError("iterations must be >= 1")
+        if iterations < 0:
+            raise ValueError("iterations must be >= 0")
         self.iterations: int = iterations
         if len(generator) <= 0:
             raise ValueError("size must be >= 1")
         self.size: int = len(generator)
         self.bins: int = 8 * self.size
 
-        self.gradient_colors: list[Color] = list(generator.no_background())
-
-        self.colored_blocks: list[str] = [
-            f"\033[{color}m█" for color in self.gradient_colors
-        ]
+        # Quantized once per style and shared with every identical bar.
+        self.color_depth: ColorDepth = resolve_color_depth(color_depth)
+        self.style: FrameStyle = frame_style(generator, self.color_depth)
+        self.colors: ColorArray = self.style.colors
+        self.colored_blocks: Sequence[str] = self.style.colored_blocks
 
         # Unfilled style
-        self.unfilled_char = "░"
-        self.unfilled_block = "\033[38;2;90;90;90m" + self.unfilled_char
+        self.unfilled_char = self.style.unfilled_char
+        self.unfilled_block = self.style.unfilled_block
+
+        self.buffer: FrameBuffer = self.style.buffer
 
         self._cached_filled: int = -1
         self._cached_visual: str = ""
@@ -61,43 +59,39 @@ class BarBackend:
         self._percentage_text = " (  0.00%)"
         self._ratio = 0.0
 
-    def _build_visual(self, filled: int) -> str:
-        if filled <= 0:
-            return self.unfilled_block * self.size + "\033[0m"
-        if filled >= self.bins:
-            return "".join(self.colored_blocks) + "\033[0m"
+    @cached_property
+    def gradient_colors(self) -> list[Color]:
+        """Per-cell ``Color`` objects, built only when first accessed."""
+        return list(self.colors)
 
-        actual_filed = filled // 8
-        partial_eights = filled % 8
+    def _build_visual(self, filled: int) -> str:
+        return self.buffer.compose(filled)
 
-        revealed = "".join(self.colored_blocks[:actual_filed])
+    def frame(self, filled: int) -> str:
+        filled = min(max(filled, 0), self.bins)
+        if filled != self._cached_filled:
+            self._cached_filled = filled
+            self._cached_visual = self._build_visual(filled)
+        return self._cached_visual
 
-        if partial_eights > 0:
-            partial = self.colored_blocks[actual_filed].replace(
-                "█", partial_block(partial_eights)
-            )
-            unfilled_count = self.size - actual_filed - 1
-        else:
-            partial = ""
-            unfilled_count = self.size - actual_filed
+    def __call__(self, progress: float) -> str:
+        return self.frame(int(self.bins * progress))
 
-        unfilled = self.unfilled_block * unfilled_count
-        return revealed + partial + unfilled + "\033[0m"
+    def memory_footprint(self) -> int:
+        """Approximate size in bytes of the master buffer and cached frame."""
+        return self.buffer.memory_footprint() + getsizeof(self._cached_visual)
 
     def generate_bar(self, iteration: int) -> str:
         ratio = iteration / self.iterations if self.iterations > 0 else 1.0
         filled = min(int(ratio * self.bins + 1e-9), self.bins)
-
-        if filled != self._cached_filled:
-            self._cached_filled = filled
-            self._cached_visual = self._build_visual(filled)
+        visual = self.frame(filled)
 
         if ratio - self._ratio > 0.001:
             self._percentage_text = " (%6.2f%%)" % (ratio * 100)
 
         iterations_text = f" {iteration:{self._total_str_size}}{self._total_str}"
 
-        return self._cached_visual + iterations_text + self._percentage_text
+        return visual + iterations_text + self._percentage_text
 
     def __iter__(self) -> Iterator[str]:
         self._cached_filled = -1
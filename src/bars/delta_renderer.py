@@ -0,0 +1,137 @@
+import sys
+from time import sleep
+from typing import Optional, Protocol, Sequence, TextIO
+
+from src.colors.color_depth import ColorDepth, reset
+from src.colors.gradient import Gradient
+from src.colors.types import color
+from src.colors.types.color_spaces import sRGB
+
+from .backend.bar import BarBackend, clip01
+from .backend.frame_buffer import PARTIAL_BLOCKS, coalesce, split_block
+
+
+class CellSource(Protocol):
+    size: int
+    bins: int
+    colored_blocks: Sequence[str]
+    unfilled_block: str
+    color_depth: ColorDepth
+
+
+class DeltaRenderer:
+    """
+    Emit only the terminal cells that changed since the previous frame.
+
+    Every frame positions the cursor with CHA (``\\033[<col>G``) relative to
+    ``column``. The first one clears from ``column`` to the end of the line
+    and draws everything; every following frame moves to the first changed
+    bar cell, rewrites the changed cells, then rewrites the changed tail of
+    the counter/stats suffix.
+    """
+
+    def __init__(self, backend: CellSource, column: int = 1) -> None:
+        self.backend = backend
+        self.column = column
+        self._filled = -1
+        self._suffix = ""
+        self._escapes = [split_block(block)[0] for block in backend.colored_blocks]
+        self._unfilled = split_block(backend.unfilled_block)
+        self._reset = reset(backend.color_depth)
+
+    def reset(self) -> None:
+        self._filled = -1
+        self._suffix = ""
+
+    def _cells(self, start: int, stop: int, filled: int) -> str:
+        full_cells, partial_eights = divmod(filled, 8)
+        escapes = self._escapes
+        cells: list[tuple[str, str]] = []
+        for index in range(start, stop):
+            if index < full_cells:
+                cells.append((escapes[index], "█"))
+            elif index == full_cells and partial_eights > 0:
+                cells.append((escapes[index], PARTIAL_BLOCKS[partial_eights]))
+            else:
+                cells.append(self._unfilled)
+        # Each chunk starts after a reset, so the SGR state is always empty.
+        return coalesce(cells)
+
+    def render(self, filled: int, counter: str = "", stats: str = "") -> str:
+        filled = min(max(filled, 0), self.backend.bins)
+        suffix = f"{counter} | {stats}" if stats else counter
+        size = self.backend.size
+
+        if self._filled < 0:
+            self._filled = filled
+            self._suffix = suffix
+            return (
+                f"\033[{self.column}G\033[K"
+                + self._cells(0, size, filled)
+                + self._reset
+                + suffix
+            )
+
+        out: list[str] = []
+        previous = self._filled
+        if filled != previous:
+            start = min(filled, previous) // 8
+            stop = min(size, (max(filled, previous) + 7) // 8)
+            out.append(f"\033[{self.column + start}G")
+            out.append(self._cells(start, stop, filled))
+            out.append(self._reset)
+            self._filled = filled
+
+        if suffix != self._suffix:
+            previous_suffix = self._suffix
+            common = 0
+            limit = min(len(suffix), len(previous_suffix))
+            while common < limit and suffix[common] == previous_suffix[common]:
+                common += 1
+            out.append(f"\033[{self.column + size + common}G")
+            out.append(suffix[common:])
+            if len(suffix) < len(previous_suffix):
+                out.append("\033[K")
+            self._suffix = suffix
+
+        return "".join(out)
+
+    def __call__(self, progress: float, counter: str = "", stats: str = "") -> str:
+        return self.render(int(self.backend.bins * clip01(progress)), counter, stats)
+
+    def write(
+        self,
+        progress: float,
+        counter: str = "",
+        stats: str = "",
+        file: Optional[TextIO] = None,
+    ) -> None:
+        frame = self(progress, counter, stats)
+        if frame:
+            out = sys.stdout if file is None else file
+            out.write(frame)
+            out.flush()
+
+
+if __name__ == "__main__":
+    MAX_ITER = 1000
+
+    red = color(sRGB(255, 0, 0))
+    green = color(sRGB(0, 255, 0))
+    backend = BarBackend(Gradient(red, green))
+    renderer = DeltaRenderer(backend)
+
+    full_bytes = 0
+    delta_bytes = 0
+    for i in range(MAX_ITER + 1):
+        progress = i / MAX_ITER
+        counter = f" {i:4}/{MAX_ITER}"
+        frame = renderer(progress, counter)
+        full_bytes += len(f"\r\033[2K{backend(progress)}{counter}".encode())
+        delta_bytes += len(frame.encode())
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        sleep(0.001)
+    print()
+    print(f"Full redraw bytes: {full_bytes}")
+    print(f"Delta bytes: {delta_bytes}")
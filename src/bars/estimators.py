@@ -0,0 +1,105 @@
+from abc import ABC, abstractmethod
+from array import array
+
+
+class Estimator(ABC):
+    """
+    Rate estimator fed with ``(timestamp, cumulative count)`` samples.
+
+    Implementations must be O(1) per sample and must not allocate, so they
+    can run on every refresh.
+    """
+
+    @abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, timestamp: float, count: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rate(self) -> float:
+        raise NotImplementedError
+
+    def eta(self, remaining: float) -> float:
+        rate = self.rate()
+        return remaining / rate if rate > 0 else float("inf")
+
+
+class EMAEstimator(Estimator):
+    """
+    Exponential moving average of the instantaneous rate.
+
+    ``smoothing`` is the weight of the newest interval: ``1.0`` reproduces
+    the raw per-interval rate, smaller values react more slowly.
+    """
+
+    def __init__(self, smoothing: float = 0.3) -> None:
+        if not (0.0 < smoothing <= 1.0):
+            raise ValueError("smoothing must be in (0, 1]")
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self) -> None:
+        self._last_time = 0.0
+        self._last_count = 0.0
+        self._rate = 0.0
+        self._samples = 0
+
+    def add(self, timestamp: float, count: float) -> None:
+        if self._samples > 0:
+            elapsed = timestamp - self._last_time
+            if elapsed <= 0:
+                return
+            instant = (count - self._last_count) / elapsed
+            if self._samples == 1:
+                self._rate = instant
+            else:
+                self._rate += self.smoothing * (instant - self._rate)
+        self._last_time = timestamp
+        self._last_count = count
+        self._samples += 1
+
+    def rate(self) -> float:
+        return self._rate
+
+
+class WindowEstimator(Estimator):
+    """
+    Average rate over the last ``size`` samples.
+
+    Samples live in two preallocated ``array('d')`` ring buffers, so adding
+    a sample overwrites the oldest one in place.
+    """
+
+    def __init__(self, size: int = 16) -> None:
+        if size < 2:
+            raise ValueError("size must be >= 2")
+        self.size = size
+        self._times = array("d", bytes(8 * size))
+        self._counts = array("d", bytes(8 * size))
+        self.reset()
+
+    def reset(self) -> None:
+        self._head = 0
+        self._filled = 0
+
+    def add(self, timestamp: float, count: float) -> None:
+        head = self._head
+        self._times[head] = timestamp
+        self._counts[head] = count
+        self._head = head + 1 if head + 1 < self.size else 0
+        if self._filled < self.size:
+            self._filled += 1
+
+    def rate(self) -> float:
+        if self._filled < 2:
+            return 0.0
+        newest = self._head - 1
+        oldest = self._head - self._filled
+        # Negative indices wrap around the ring buffer.
+        elapsed = self._times[newest] - self._times[oldest]
+        if elapsed <= 0:
+            return 0.0
+        return (self._counts[newest] - self._counts[oldest]) / elapsed
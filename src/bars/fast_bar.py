@@ -1,35 +1,270 @@
-from time import sleep, time
-from typing import Iterator, Optional
+from functools import cache
+from io import StringIO
+from itertools import count, islice
+from operator import itemgetter, length_hint
+from time import monotonic, sleep, time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    TypeVar,
+    overload,
+)
 
-from src.colors.gradient import Gradient, GradientGenerator
-from src.colors.static_color import StaticColorGenerator
-from src.colors.types import ColorGenerator, color
-from src.colors.types.color_spaces import sRGB
+from .estimators import EMAEstimator, Estimator
+from .refresh import RefreshPolicy
+from .render_thread import RenderThread
+from .stats import format_estimate, format_stream_stats
 
-from .bar_backend import BarBackend
+if TYPE_CHECKING:
+    from src.colors.types import ColorGenerator, ColorWithBackground
 
-WHITE_BLACK_BG = color(sRGB(255, 255, 255), sRGB(0, 0, 0))
-DEFAULT_WHITE_BAR = StaticColorGenerator(50, WHITE_BLACK_BG)
+    from .backend.bounce import BounceBackend
 
+T = TypeVar("T")
 
-class FastBar:
+
+@cache
+def white_black_bg() -> "ColorWithBackground":
+    from src.colors.types import color
+    from src.colors.types.color_spaces import sRGB
+
+    return color(sRGB(255, 255, 255), sRGB(0, 0, 0))
+
+
+@cache
+def default_white_bar() -> "ColorGenerator":
+    from src.colors.static_color import StaticColorGenerator
+
+    return StaticColorGenerator(50, white_black_bg())
+
+
+def __getattr__(name: str) -> Any:
+    # The color machinery is only imported once a bar needs its defaults,
+    # which keeps ``import src.bars.fast_bar`` cheap for short-lived CLIs.
+    if name == "WHITE_BLACK_BG":
+        return white_black_bg()
+    if name == "DEFAULT_WHITE_BAR":
+        return default_white_bar()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class FastBar(Generic[T]):
+    """
+    ``FastBar(n)`` yields one formatted frame string per bar state.
+
+    ``FastBar(iterable)`` instead yields the items of ``iterable`` and draws
+    the bar out of band from a :class:`RenderThread`. The total comes from
+    ``total``, ``len()`` or ``__length_hint__``; when none is available the
+    bar switches to an indeterminate :class:`BounceBackend` animation showing
+    count, rate and elapsed time.
+    """
+
+    @overload
     def __init__(
-        self,
+        self: "FastBar[str]",
         iterations: int,
-        generator: ColorGenerator = DEFAULT_WHITE_BAR,
+        generator: Optional["ColorGenerator"] = ...,
+        update_every: Optional[int] = ...,
+        refresh: Optional[RefreshPolicy] = ...,
+        total: Optional[int] = ...,
+        interval: float = ...,
+        file: Optional[TextIO] = ...,
+        estimator: Optional[Estimator] = ...,
+    ) -> None: ...
+    @overload
+    def __init__(
+        self: "FastBar[T]",
+        iterations: Iterable[T],
+        generator: Optional["ColorGenerator"] = ...,
+        update_every: Optional[int] = ...,
+        refresh: Optional[RefreshPolicy] = ...,
+        total: Optional[int] = ...,
+        interval: float = ...,
+        file: Optional[TextIO] = ...,
+        estimator: Optional[Estimator] = ...,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        iterations: int | Iterable[T],
+        generator: Optional["ColorGenerator"] = None,
         update_every: Optional[int] = 1,
+        refresh: Optional[RefreshPolicy] = None,
+        total: Optional[int] = None,
+        interval: float = 0.1,
+        file: Optional[TextIO] = None,
+        estimator: Optional[Estimator] = None,
     ) -> None:
-        self.backend = BarBackend(iterations, generator)
+        from .backend.bounce import BounceBackend
+        from .bar_backend import BarBackend
+
+        if generator is None:
+            generator = default_white_bar()
+        self.iterable: Optional[Iterable[T]] = None
+        self.bounce: Optional[BounceBackend] = None
+        if not isinstance(iterations, int):
+            self.iterable = iterations
+            if total is None:
+                # -1 marks an unknown length; an empty sized input is 0.
+                total = length_hint(iterations, -1)
+            iterations = total
+        if self.iterable is not None and iterations < 0:
+            self.bounce = BounceBackend(generator)
+        else:
+            self.backend = BarBackend(iterations, generator)
         self.update_every = update_every
+        self.refresh = refresh
+        self.interval = interval
+        self.file = file
+        self.estimator: Estimator = EMAEstimator() if estimator is None else estimator
+        self.count = 0
         self.last_stats = "0.0it/s | ETA ?:??"
         self.frame_count = 0
         self.start_time = self.last_time = time()
+        self._position: Iterator[int] = iter(())
+        self._started = monotonic()
+        self._tick = 0
 
     def __len__(self) -> int:
+        if self.bounce is not None:
+            raise TypeError("FastBar over an iterable of unknown length has no len()")
         return self.backend.iterations
 
-    def __iter__(self) -> Iterator[str]:
-        if self.update_every is not None:
+    def _restart_estimator(self, now: float) -> None:
+        self.estimator.reset()
+        self.estimator.add(now, 0)
+
+    def _estimate(self, now: float, count: int, remaining: int) -> str:
+        self.estimator.add(now, count)
+        return format_estimate(self.estimator, remaining)
+
+    def _iter_refresh(self, policy: RefreshPolicy) -> Iterator[str]:
+        if self.bounce is not None:
+            raise TypeError("FastBar over an iterable of unknown length has no frames")
+        iterations = self.backend.iterations
+        policy.reset()
+        self._restart_estimator(policy.last_refresh)
+        frame = f"{self.backend.generate_bar(0)} | {self.last_stats}"
+
+        for i in range(iterations + 1):
+            if i == iterations or policy.should_refresh(i):
+                now = monotonic()
+                self.last_stats = self._estimate(now, i, iterations - i)
+                frame = f"{self.backend.generate_bar(i)} | {self.last_stats}"
+                policy.refreshed(i, monotonic() - now)
+            # Between refreshes the previous frame object is yielded as is.
+            yield frame
+
+    def _sample_stream(self, bounce: "BounceBackend") -> str:
+        count = self.count
+        now = monotonic()
+        self.estimator.add(now, count)
+        self.last_stats = format_stream_stats(
+            count, self.estimator.rate(), now - self._started
+        )
+        self._tick += 1
+        return f"{bounce(self._tick)} {self.last_stats}"
+
+    def _sample(self) -> str:
+        if self.bounce is not None:
+            return self._sample_stream(self.bounce)
+        iterations = self.backend.iterations
+        if self.iterable is not None:
+            count = min(self.count, iterations)
+        else:
+            count = iterations - length_hint(self._position)
+        self.last_stats = self._estimate(monotonic(), count, iterations - count)
+        return f"{self.backend.generate_bar(count)} | {self.last_stats}"
+
+    def background(
+        self,
+        interval: Optional[float] = None,
+        file: Optional[TextIO] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield ``0..iterations-1`` while a daemon thread draws the bar.
+
+        The loop never touches the bar: it delegates to a plain range
+        iterator, and the render thread reads that iterator's position
+        through ``length_hint`` every ``interval`` seconds. A bar over an
+        iterable yields its items instead, exactly like iterating the bar.
+        ``interval`` and ``file`` default to the bar's own.
+        """
+        if interval is None:
+            interval = self.interval
+        if file is None:
+            file = self.file
+        if self.iterable is not None:
+            yield from self._iter_items(self.iterable, interval, file)
+            return
+        self._position = iter(range(self.backend.iterations))
+        self._restart_estimator(monotonic())
+        renderer = RenderThread(self._sample, interval, file)
+        renderer.start()
+        try:
+            yield from self._position
+        finally:
+            renderer.close()
+
+    def _iter_items(
+        self,
+        iterable: Iterable[T],
+        interval: Optional[float] = None,
+        file: Optional[TextIO] = None,
+    ) -> Iterator[T]:
+        if interval is None:
+            interval = self.interval
+        if file is None:
+            file = self.file
+        # zip() with a C-level counter tallies consumed items without any
+        # bytecode per item; the tally is read once per chunk.
+        consumed = count()
+        # Not strict: closing the generator early must just stop the count.
+        items = map(itemgetter(0), zip(iterable, consumed, strict=False))
+        probes = 0
+        chunk = 1
+        self.count = 0
+        self._started = monotonic()
+        self._restart_estimator(self._started)
+        renderer = RenderThread(self._sample, interval, file)
+        renderer.start()
+        try:
+            while True:
+                start = monotonic()
+                yield from islice(items, chunk)
+                done = next(consumed) - probes
+                probes += 1
+                exhausted = done - self.count < chunk
+                self.count = done
+                if exhausted:
+                    break
+                # Aim for about ten count updates per refresh interval.
+                elapsed = monotonic() - start
+                if elapsed < interval / 10:
+                    chunk *= 2
+                elif elapsed > interval and chunk > 1:
+                    chunk //= 2
+        finally:
+            renderer.close()
+
+    def __iter__(self) -> Iterator[T]:
+        if self.iterable is not None:
+            yield from self._iter_items(self.iterable)
+        else:
+            yield from self._iter_frames()  # type: ignore[misc]
+
+    def _iter_frames(self) -> Iterator[str]:
+        if self.bounce is not None:
+            raise TypeError("FastBar over an iterable of unknown length has no frames")
+        if self.refresh is not None:
+            yield from self._iter_refresh(self.refresh)
+        elif self.update_every is not None:
+            self._restart_estimator(time())
             for i, base_bar in enumerate(self.backend):
                 self.frame_count += 1
 
@@ -38,14 +273,9 @@ class FastBar:
                     or i == self.backend.iterations
                 ):
                     now = time()
-                    elapsed = now - self.last_time
-                    if elapsed > 0:
-                        speed = self.update_every / elapsed
-                        remaining = self.backend.iterations - i
-                        eta = remaining / speed if speed > 0 else float("inf")
-                        eta_str = f"{eta:.0f}s" if eta < 999 else "∞"
-                        self.last_stats = f"{speed:.1f}it/s | ETA {eta_str}"
-
+                    self.last_stats = self._estimate(
+                        now, i, self.backend.iterations - i
+                    )
                     self.last_time = now
 
                 yield f"{base_bar} | {self.last_stats}"
@@ -54,11 +284,24 @@ class FastBar:
 
 
 if __name__ == "__main__":
+    from src.colors.gradient import Gradient, GradientGenerator
+    from src.colors.types import color
+    from src.colors.types.color_spaces import sRGB
+
+    for _ in FastBar(["wrapping", "a", "list"] * 100):
+        sleep(0.001)
+
+    for _ in FastBar(word for word in ["streaming", "a", "generator"] * 100):
+        sleep(0.005)
+
     red_on_black = color(sRGB(255, 0, 0), sRGB(0, 0, 0))
     green_on_white = color(sRGB(0, 255, 0), sRGB(255, 255, 255))
     red_green_gradient = GradientGenerator(25, Gradient(red_on_black, green_on_white))
     bar = FastBar(1000, red_green_gradient)
     bar_no_speed = FastBar(1000, red_green_gradient, update_every=None)
+    bar_refresh = FastBar(
+        1000, red_green_gradient, refresh=RefreshPolicy(max_fps=30, overhead=0.01)
+    )
 
     for bar_str in bar:
         print(f"\r\033[2K{bar_str}", end="", flush=True)
@@ -82,6 +325,20 @@ if __name__ == "__main__":
     b = time()
     custom_bar_no_speed_time = b - a
 
+    a = time()
+    for _ in range(100):
+        for _ in bar_refresh:
+            pass
+    b = time()
+    custom_bar_refresh_time = b - a
+
+    a = time()
+    for _ in range(100):
+        for _ in bar.background(file=StringIO()):
+            pass
+    b = time()
+    custom_bar_background_time = b - a
+
     a = time()
     for _ in range(100):
         for _ in range(1000):
@@ -91,4 +348,6 @@ if __name__ == "__main__":
     print()
     print(f"Custom bar time: {custom_bar_time:.6f}s")
     print(f"Custom bar (no speed) time: {custom_bar_no_speed_time:.6f}s")
+    print(f"Custom bar (refresh policy) time: {custom_bar_refresh_time:.6f}s")
+    print(f"Custom bar (background) time: {custom_bar_background_time:.6f}s")
     print(f"Normal print time: {normal_print_time:.6f}s")
@@ -1,28 +1,49 @@
-from time import sleep, time
-from typing import Iterator, Optional
+from time import monotonic, sleep, time
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-from src.colors.gradient import Gradient
-from src.colors.pallete import Pallete
-from src.colors.types import ColorType, color
-from src.colors.types.color_spaces import sRGB
+from .estimators import EMAEstimator, Estimator
+from .fast_bar import white_black_bg
+from .refresh import RefreshPolicy
+from .stats import format_estimate
 
-from .backend.bar import BarBackend
+if TYPE_CHECKING:
+    from src.colors.gradient import Gradient
+    from src.colors.pallete import Pallete
+    from src.colors.types import ColorType
 
-WHITE_BLACK_BG = color(sRGB(255, 255, 255), sRGB(0, 0, 0))
+    from .backend.strategy import FrameBackend
+
+
+def __getattr__(name: str) -> Any:
+    # Built on first use, like the defaults of ``fast_bar``.
+    if name == "WHITE_BLACK_BG":
+        return white_black_bg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class FastBar:
     def __init__(
         self,
         iterations: int,
-        colors: ColorType | Pallete | Gradient = WHITE_BLACK_BG,
+        colors: Optional["ColorType | Pallete | Gradient"] = None,
         size: int = 50,
         repeat_pallete: bool = False,
         update_every: Optional[int] = 1,
+        refresh: Optional[RefreshPolicy] = None,
+        estimator: Optional[Estimator] = None,
     ) -> None:
+        from .backend.bar import BarBackend
+
         self.iterations = iterations
-        self.bar = BarBackend(colors, size, repeat_pallete)
+        self.bar: "FrameBackend" = BarBackend(
+            white_black_bg() if colors is None else colors,
+            size,
+            repeat_pallete,
+            expected_frames=iterations + 1,
+        )
         self.update_every = update_every
+        self.refresh = refresh
+        self.estimator: Estimator = EMAEstimator() if estimator is None else estimator
         self.last_stats = "0.0it/s | ETA ?:??"
         self.frame_count = 0
         self.start_time = self.last_time = time()
@@ -30,21 +51,37 @@ class FastBar:
     def __len__(self) -> int:
         return self.iterations
 
+    def _estimate(self, now: float, count: int) -> str:
+        self.estimator.add(now, count)
+        return format_estimate(self.estimator, self.iterations - count)
+
+    def _iter_refresh(self, policy: RefreshPolicy) -> Iterator[str]:
+        policy.reset()
+        self.estimator.reset()
+        self.estimator.add(policy.last_refresh, 0)
+        frame = f"{self.bar(0.0)} | {self.last_stats}"
+
+        for i in range(self.iterations + 1):
+            if i == self.iterations or policy.should_refresh(i):
+                now = monotonic()
+                self.last_stats = self._estimate(now, i)
+                frame = f"{self.bar(i / self.iterations)} | {self.last_stats}"
+                policy.refreshed(i, monotonic() - now)
+            # Between refreshes the previous frame object is yielded as is.
+            yield frame
+
     def __iter__(self) -> Iterator[str]:
-        if self.update_every is not None:
+        if self.refresh is not None:
+            yield from self._iter_refresh(self.refresh)
+        elif self.update_every is not None:
+            self.estimator.reset()
+            self.estimator.add(time(), 0)
             for i in range(self.iterations + 1):
                 self.frame_count += 1
 
                 if self.frame_count % self.update_every == 0 or i == self.iterations:
                     now = time()
-                    elapsed = now - self.last_time
-                    if elapsed > 0:
-                        speed = self.update_every / elapsed
-                        remaining = self.iterations - i
-                        eta = remaining / speed if speed > 0 else float("inf")
-                        eta_str = f"{eta:.0f}s" if eta < 999 else "∞"
-                        self.last_stats = f"{speed:.1f}it/s | ETA {eta_str}"
-
+                    self.last_stats = self._estimate(now, i)
                     self.last_time = now
 
                 yield f"{self.bar(i / self.iterations)} | {self.last_stats}"
@@ -54,11 +91,18 @@ class FastBar:
 
 
 if __name__ == "__main__":
+    from src.colors.gradient import Gradient
+    from src.colors.types import color
+    from src.colors.types.color_spaces import sRGB
+
     red_on_black = color(sRGB(255, 0, 0), sRGB(0, 0, 0))
     green_on_white = color(sRGB(0, 255, 0), sRGB(255, 255, 255))
     red_green_gradient = Gradient(red_on_black, green_on_white)
     bar = FastBar(1000, red_green_gradient)
     bar_no_speed = FastBar(1000, red_green_gradient, update_every=None)
+    bar_refresh = FastBar(
+        1000, red_green_gradient, refresh=RefreshPolicy(max_fps=30, overhead=0.01)
+    )
 
     for bar_str in bar:
         print(f"\r\033[2K{bar_str}", end="", flush=True)
@@ -82,6 +126,13 @@ if __name__ == "__main__":
     b = time()
     custom_bar_no_speed_time = b - a
 
+    a = time()
+    for _ in range(100):
+        for _ in bar_refresh:
+            pass
+    b = time()
+    custom_bar_refresh_time = b - a
+
     a = time()
     for _ in range(100):
         for _ in range(1000):
@@ -92,4 +143,5 @@ if __name__ == "__main__":
     print()
     print(f"Custom bar time: {custom_bar_time:.6f}s")
     print(f"Custom bar (no speed) time: {custom_bar_no_speed_time:.6f}s")
+    print(f"Custom bar (refresh policy) time: {custom_bar_refresh_time:.6f}s")
     print(f"Normal print time: {normal_print_time:.6f}s")
@@ -0,0 +1,219 @@
+import mmap
+import os
+import sys
+import tempfile
+from time import monotonic
+from typing import BinaryIO, Iterator, Optional, TextIO
+
+from src.colors.gradient import Gradient
+from src.colors.pallete import Pallete
+from src.colors.types import ColorType, color
+from src.colors.types.color_spaces import sRGB
+
+from .backend.bar import BarBackend
+from .backend.strategy import FrameBackend
+from .estimators import EMAEstimator, Estimator
+from .fast_bar import white_black_bg
+from .stats import format_byte_stats, format_bytes
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class ByteBar:
+    """
+    Bar advanced by byte counts, one call per chunk.
+
+    The bytes-to-bins factor is computed once, so :meth:`advance` does one
+    multiplication per chunk and looks the frame up in the precomputed
+    ``BarBackend`` table. Redraws are limited to one per ``interval``.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        colors: Optional[ColorType | Pallete | Gradient] = None,
+        size: int = 50,
+        interval: float = 0.1,
+        file: Optional[TextIO] = None,
+        estimator: Optional[Estimator] = None,
+    ) -> None:
+        if total <= 0:
+            raise ValueError("total must be >= 1")
+        self.total = total
+        self.backend: FrameBackend = BarBackend(
+            white_black_bg() if colors is None else colors, size
+        )
+        self.bins_per_byte = self.backend.bins / total
+        self.interval = interval
+        self.file = sys.stdout if file is None else file
+        self.position = 0
+        self.last_stats = "0.0B/s | ETA ?:??"
+        self._total_text = format_bytes(total)
+        self._bin = -1
+        self.estimator: Estimator = EMAEstimator() if estimator is None else estimator
+        self._last_time = monotonic()
+        self.estimator.add(self._last_time, 0)
+
+    def advance(self, n: int) -> None:
+        self.position += n
+        filled = min(int(self.position * self.bins_per_byte), self.backend.bins)
+        if filled == self._bin and self.position < self.total:
+            return
+        now = monotonic()
+        if now - self._last_time < self.interval and self.position < self.total:
+            return
+        self.estimator.add(now, self.position)
+        self.last_stats = format_byte_stats(
+            self.estimator, max(self.total - self.position, 0)
+        )
+        self._bin = filled
+        self._last_time = now
+        self.file.write(f"\r\033[2K{self.frame()}")
+        self.file.flush()
+
+    def frame(self) -> str:
+        filled = min(int(self.position * self.bins_per_byte), self.backend.bins)
+        return (
+            f"{self.backend.frame(filled)} "
+            f"{format_bytes(self.position)}/{self._total_text} | {self.last_stats}"
+        )
+
+    def close(self) -> None:
+        self.file.write("\n")
+        self.file.flush()
+
+
+class ProgressReader:
+    """
+    Binary file wrapper that advances a :class:`ByteBar` on every read.
+
+    Prefer :meth:`readinto` with a reusable buffer: the data lands directly
+    in the caller's buffer and the bar only sees the byte count.
+    """
+
+    def __init__(self, raw: BinaryIO, bar: ByteBar) -> None:
+        self.raw = raw
+        self.bar = bar
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.bar.advance(len(data))
+        return data
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        n = self.raw.readinto(buffer)  # type: ignore[attr-defined]
+        if n:
+            self.bar.advance(n)
+        return n or 0
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.raw, name)
+
+    def __enter__(self) -> "ProgressReader":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.raw.close()
+        self.bar.close()
+
+
+class ProgressWriter:
+    """Binary file wrapper that advances a :class:`ByteBar` on every write."""
+
+    def __init__(self, raw: BinaryIO, bar: ByteBar) -> None:
+        self.raw = raw
+        self.bar = bar
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        n = self.raw.write(data)
+        self.bar.advance(n)
+        return n
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.raw, name)
+
+    def __enter__(self) -> "ProgressWriter":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.raw.close()
+        self.bar.close()
+
+
+def open_read(
+    path: str | os.PathLike[str],
+    colors: Optional[ColorType | Pallete | Gradient] = None,
+    file: Optional[TextIO] = None,
+) -> ProgressReader:
+    raw = open(path, "rb", buffering=0)
+    total = os.fstat(raw.fileno()).st_size
+    return ProgressReader(raw, ByteBar(max(total, 1), colors, file=file))
+
+
+def mmap_chunks(
+    path: str | os.PathLike[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    bar: Optional[ByteBar] = None,
+) -> Iterator[memoryview]:
+    """
+    Yield zero-copy ``memoryview`` slices of a memory-mapped file.
+
+    Each slice is only valid until the next one is requested.
+    """
+    with open(path, "rb") as raw:
+        size = os.fstat(raw.fileno()).st_size
+        if bar is None:
+            bar = ByteBar(max(size, 1))
+        if size == 0:
+            bar.close()
+            return
+        with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, size, chunk_size):
+                    chunk = view[start : start + chunk_size]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+                    bar.advance(min(chunk_size, size - start))
+            finally:
+                view.release()
+                bar.close()
+
+
+def copy_file(
+    source: str | os.PathLike[str],
+    destination: str | os.PathLike[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    colors: Optional[ColorType | Pallete | Gradient] = None,
+    file: Optional[TextIO] = None,
+) -> int:
+    """Copy ``source`` to ``destination`` through one reusable buffer."""
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    copied = 0
+    with open_read(source, colors, file) as reader:
+        with open(destination, "wb") as writer:
+            while n := reader.readinto(view):
+                writer.write(view[:n])
+                copied += n
+    return copied
+
+
+if __name__ == "__main__":
+    cyan = color(sRGB(0, 255, 255))
+    magenta = color(sRGB(255, 0, 255))
+    gradient = Gradient(cyan, magenta)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.bin")
+        with open(source, "wb") as out:
+            out.write(os.urandom(64 * DEFAULT_CHUNK_SIZE))
+
+        copy_file(source, os.path.join(directory, "copy.bin"), colors=gradient)
+
+        checksum = 0
+        for chunk in mmap_chunks(source, bar=ByteBar(os.path.getsize(source))):
+            checksum ^= chunk[0]
+        print(f"checksum: {checksum}")
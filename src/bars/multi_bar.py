@@ -0,0 +1,117 @@
+import sys
+from time import monotonic, sleep
+from typing import Iterable, Iterator, Optional, TextIO
+
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.types import color
+from src.colors.types.color_spaces import sRGB
+
+from .fast_bar import FastBar
+from .refresh import RefreshPolicy
+
+
+class MultiBar:
+    """
+    Own a region of terminal lines and paint many bars in one write.
+
+    Bars publish their latest frame with :meth:`update`, which only records
+    the frame and marks its line dirty. :meth:`refresh` then repaints every
+    dirty line with a single ``write``/``flush``, moving between lines with
+    cursor previous/next line sequences (``\\033[<n>F`` / ``\\033[<n>E``).
+    The cursor rests on the line just below the region between refreshes.
+    """
+
+    def __init__(
+        self,
+        lines: int = 0,
+        file: Optional[TextIO] = None,
+        max_fps: float = 10.0,
+    ) -> None:
+        if max_fps <= 0:
+            raise ValueError("max_fps must be > 0")
+        self.file = sys.stdout if file is None else file
+        self.min_interval = 1.0 / max_fps
+        self._frames: list[str] = [""] * lines
+        self._dirty: set[int] = set()
+        self._drawn = 0
+        self._last_refresh = 0.0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def add(self, frame: str = "") -> int:
+        self._frames.append(frame)
+        index = len(self._frames) - 1
+        self._dirty.add(index)
+        return index
+
+    def update(self, index: int, frame: str) -> None:
+        if frame is not self._frames[index]:
+            self._frames[index] = frame
+            self._dirty.add(index)
+
+    def track(self, index: int, frames: Iterable[str]) -> Iterator[str]:
+        for frame in frames:
+            self.update(index, frame)
+            self.tick()
+            yield frame
+
+    def tick(self) -> None:
+        if self._dirty and monotonic() - self._last_refresh >= self.min_interval:
+            self.refresh()
+
+    def refresh(self) -> None:
+        lines = len(self._frames)
+        out: list[str] = []
+        if self._drawn < lines:
+            # Grow the region; the cursor ends up below the last line again.
+            out.append("\n" * (lines - self._drawn))
+            self._drawn = lines
+
+        cursor = lines
+        for index in sorted(self._dirty):
+            if index < cursor:
+                out.append(f"\033[{cursor - index}F")
+            else:
+                out.append(f"\033[{index - cursor}E")
+            out.append("\033[2K")
+            out.append(self._frames[index])
+            cursor = index
+        if cursor < lines:
+            out.append(f"\033[{lines - cursor}E")
+        self._dirty.clear()
+
+        self.file.write("".join(out))
+        self.file.flush()
+        self._last_refresh = monotonic()
+
+    def close(self) -> None:
+        self.refresh()
+
+    def __enter__(self) -> "MultiBar":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    red = color(sRGB(255, 0, 0))
+    blue = color(sRGB(0, 0, 255))
+    generator = GradientGenerator(30, Gradient(red, blue))
+
+    shards = [
+        iter(FastBar(200 * (shard + 1), generator, refresh=RefreshPolicy(30)))
+        for shard in range(4)
+    ]
+    with MultiBar(len(shards), max_fps=30) as multi:
+        active = list(range(len(shards)))
+        while active:
+            for index in list(active):
+                frame = next(shards[index], None)
+                if frame is None:
+                    active.remove(index)
+                else:
+                    multi.update(index, frame)
+            multi.tick()
+            sleep(0.001)
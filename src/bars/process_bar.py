@@ -0,0 +1,151 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, TextIO
+
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.types import ColorGenerator, color
+from src.colors.types.color_spaces import sRGB
+
+from .sharded import SharedBar
+
+SLOT_SIZE = 8  # one signed 64-bit integer per slot
+
+
+def _counters(shm: SharedMemory, slots: int) -> memoryview:
+    buf = shm.buf
+    if buf is None:
+        raise ValueError("shared memory block is closed")
+    return buf[: slots * SLOT_SIZE].cast("q")
+
+
+class SlotCounter:
+    """
+    Picklable handle to one slot of a :class:`SharedCounterArray`.
+
+    The shared memory block is attached lazily in whichever process first
+    calls :meth:`add`, so the handle can be sent to pool workers. Each slot
+    must have a single writer; increments are plain stores.
+    """
+
+    def __init__(self, name: str, slots: int, index: int) -> None:
+        if not (0 <= index < slots):
+            raise IndexError("slot index out of range")
+        self.name = name
+        self.slots = slots
+        self.index = index
+        self._shm: Optional[SharedMemory] = None
+        self._view: Optional[memoryview] = None
+
+    def __getstate__(self) -> tuple[str, int, int]:
+        return (self.name, self.slots, self.index)
+
+    def __setstate__(self, state: tuple[str, int, int]) -> None:
+        self.__init__(*state)
+
+    def _attach(self) -> memoryview:
+        # The parent owns the block; do not let the resource tracker of a
+        # child process unlink it on exit.
+        self._shm = SharedMemory(name=self.name, track=False)
+        self._view = _counters(self._shm, self.slots)
+        return self._view
+
+    def add(self, n: int = 1) -> None:
+        view = self._view
+        if view is None:
+            view = self._attach()
+        view[self.index] += n
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+
+class SharedCounterArray:
+    """
+    Array of per-worker counters living in ``multiprocessing.shared_memory``.
+
+    Slot ``i`` is meant for worker ``i`` (see :meth:`slot`); the extra last
+    slot belongs to the creating process so :meth:`add` works there too.
+    :meth:`value` sums every slot.
+    """
+
+    def __init__(self, slots: int) -> None:
+        if slots <= 0:
+            raise ValueError("slots must be >= 1")
+        self.slots = slots + 1
+        self._shm = SharedMemory(create=True, size=self.slots * SLOT_SIZE)
+        self._view = _counters(self._shm, self.slots)
+        for index in range(self.slots):
+            self._view[index] = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def slot(self, index: int) -> SlotCounter:
+        return SlotCounter(self.name, self.slots, index)
+
+    def add(self, n: int = 1) -> None:
+        self._view[self.slots - 1] += n
+
+    def value(self) -> int:
+        return sum(self._view)
+
+    def close(self) -> None:
+        self._view.release()
+        self._shm.close()
+        self._shm.unlink()
+
+
+class ProcessBar(SharedBar):
+    """
+    Parent-side bar advanced by worker processes through shared memory.
+
+    Hand ``bar.slot(i)`` to worker ``i``; workers call ``add`` on it and the
+    render thread aggregates all slots on every refresh.
+    """
+
+    def __init__(
+        self,
+        iterations: int,
+        workers: int,
+        generator: Optional[ColorGenerator] = None,
+        interval: float = 0.1,
+        file: Optional[TextIO] = None,
+    ) -> None:
+        self.shared = SharedCounterArray(workers)
+        super().__init__(iterations, generator, interval, file, self.shared)
+
+    def slot(self, index: int) -> SlotCounter:
+        return self.shared.slot(index)
+
+    def close(self) -> None:
+        super().close()
+        self.shared.close()
+
+
+def _work(counter: SlotCounter, items: int) -> int:
+    total = 0
+    for i in range(items):
+        total += i * i
+        counter.add()
+    counter.close()
+    return total
+
+
+if __name__ == "__main__":
+    WORKERS = 4
+    ITEMS = 500_000
+
+    red = color(sRGB(255, 0, 0))
+    green = color(sRGB(0, 255, 0))
+    generator = GradientGenerator(40, Gradient(red, green))
+
+    with ProcessBar(WORKERS * ITEMS, WORKERS, generator) as bar:
+        with ProcessPoolExecutor(WORKERS) as pool:
+            slots = [bar.slot(i) for i in range(WORKERS)]
+            list(pool.map(_work, slots, [ITEMS] * WORKERS))
@@ -0,0 +1,91 @@
+from time import monotonic
+from typing import Optional
+
+
+class RefreshPolicy:
+    """
+    Decide when a bar should redraw, based on a monotonic clock.
+
+    The clock is only read every ``next_check`` iterations. That stride is
+    re-estimated after every refresh from the observed iteration rate, so
+    cheap loops check the clock rarely and slow loops check it every time
+    (a dynamic ``miniters``).
+
+    Parameters
+    ----------
+    max_fps : float
+        Upper bound on refreshes per second.
+    overhead : float, optional
+        Fraction of the loop time the bar may spend redrawing (e.g. ``0.01``
+        for 1%). When a refresh is expensive the interval between refreshes
+        is stretched so that ``cost / interval <= overhead``.
+    miniters : int
+        Lower bound on the number of iterations between clock checks.
+    maxiters : int
+        Upper bound on the number of iterations between clock checks. The
+        stride is projected from the last observed rate, so without a cap a
+        loop that suddenly slows down could go hours without a redraw.
+    """
+
+    def __init__(
+        self,
+        max_fps: float = 10.0,
+        overhead: Optional[float] = None,
+        miniters: int = 1,
+        maxiters: int = 1000,
+    ) -> None:
+        if max_fps <= 0:
+            raise ValueError("max_fps must be > 0")
+        if overhead is not None and not (0.0 < overhead < 1.0):
+            raise ValueError("overhead must be in the open interval (0, 1)")
+        if miniters <= 0:
+            raise ValueError("miniters must be >= 1")
+        if maxiters < miniters:
+            raise ValueError("maxiters must be >= miniters")
+        self.min_interval: float = 1.0 / max_fps
+        self.overhead = overhead
+        self.miniters = miniters
+        self.maxiters = maxiters
+        self.reset()
+
+    def reset(self) -> None:
+        self.interval: float = self.min_interval
+        self.next_check: int = self.miniters
+        self.last_iteration: int = 0
+        self.last_refresh: float = monotonic()
+
+    def should_refresh(self, iteration: int) -> bool:
+        if iteration < self.next_check:
+            return False
+        now = monotonic()
+        elapsed = now - self.last_refresh
+        if elapsed >= self.interval:
+            return True
+        # Too early: skip ahead by the number of iterations expected to fit
+        # in the rest of the interval at the current rate.
+        done = iteration - self.last_iteration
+        if elapsed > 0 and done > 0:
+            step = int(done * (self.interval - elapsed) / elapsed)
+        else:
+            step = self.miniters
+        self.next_check = iteration + self._clamp(step)
+        return False
+
+    def _clamp(self, step: int) -> int:
+        return min(max(self.miniters, step), self.maxiters)
+
+    def refreshed(self, iteration: int, cost: float = 0.0) -> None:
+        now = monotonic()
+        elapsed = now - self.last_refresh
+        done = iteration - self.last_iteration
+
+        if self.overhead is not None:
+            self.interval = max(self.min_interval, cost / self.overhead)
+
+        if elapsed > 0 and done > 0:
+            step = int(done * self.interval / elapsed)
+        else:
+            step = self.miniters
+        self.next_check = iteration + self._clamp(step)
+        self.last_iteration = iteration
+        self.last_refresh = now
@@ -0,0 +1,45 @@
+import sys
+import threading
+from typing import Callable, Optional, TextIO
+
+
+class RenderThread(threading.Thread):
+    """
+    Daemon thread that samples ``render()`` every ``interval`` seconds and
+    redraws the current line when the returned frame changed.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        interval: float = 0.1,
+        file: Optional[TextIO] = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        super().__init__(daemon=True)
+        self.render = render
+        self.interval = interval
+        self.file = sys.stdout if file is None else file
+        self._finished = threading.Event()
+        self._last_frame = ""
+
+    def run(self) -> None:
+        while not self._finished.wait(self.interval):
+            self.paint()
+
+    def paint(self) -> None:
+        frame = self.render()
+        if frame != self._last_frame:
+            self._last_frame = frame
+            self.file.write(f"\r\033[2K{frame}")
+            self.file.flush()
+
+    def close(self) -> None:
+        """Stop sampling, paint the final frame and end the line."""
+        self._finished.set()
+        if self.is_alive():
+            self.join()
+        self.paint()
+        self.file.write("\n")
+        self.file.flush()
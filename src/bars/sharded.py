@@ -0,0 +1,132 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Optional, Protocol, Self, TextIO
+
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.types import ColorGenerator, color
+from src.colors.types.color_spaces import sRGB
+
+from .bar_backend import BarBackend
+from .estimators import EMAEstimator, Estimator
+from .fast_bar import default_white_bar
+from .render_thread import RenderThread
+from .stats import format_estimate
+
+
+class Counter(Protocol):
+    def add(self, n: int = 1) -> None: ...
+
+    def value(self) -> int: ...
+
+
+class ShardedCounter:
+    """
+    Counter where every thread increments its own shard.
+
+    A shard is a one-element list owned by a single writer thread, so
+    :meth:`add` never takes a lock. The lock is only held when a thread
+    registers its shard on first use. :meth:`value` sums all shards; it may
+    lag behind concurrent writers but never loses increments.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[list[int]] = []
+        self._lock = threading.Lock()
+
+    def _register(self) -> list[int]:
+        shard = [0]
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def add(self, n: int = 1) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._register()
+        shard[0] += n
+
+    def value(self) -> int:
+        with self._lock:
+            shards = tuple(self._shards)
+        return sum(shard[0] for shard in shards)
+
+
+class SharedBar:
+    """
+    Progress bar that any number of threads can advance concurrently.
+
+    Worker threads call :meth:`update`, which only bumps their own shard of a
+    :class:`ShardedCounter`. A :class:`RenderThread` periodically sums the
+    shards and drives the :class:`BarBackend`. Any other ``counter`` with
+    ``add``/``value`` can be plugged in instead.
+    """
+
+    def __init__(
+        self,
+        iterations: int,
+        generator: Optional[ColorGenerator] = None,
+        interval: float = 0.1,
+        file: Optional[TextIO] = None,
+        counter: Optional[Counter] = None,
+        estimator: Optional[Estimator] = None,
+    ) -> None:
+        if generator is None:
+            generator = default_white_bar()
+        self.backend = BarBackend(iterations, generator)
+        self.counter: Counter = ShardedCounter() if counter is None else counter
+        self.last_stats = "0.0it/s | ETA ?:??"
+        self.estimator: Estimator = EMAEstimator() if estimator is None else estimator
+        self.estimator.add(monotonic(), 0)
+        self._last_count = 0
+        self._renderer = RenderThread(self.frame, interval, file)
+
+    def __len__(self) -> int:
+        return self.backend.iterations
+
+    def update(self, n: int = 1) -> None:
+        self.counter.add(n)
+
+    def frame(self) -> str:
+        count = min(self.counter.value(), self.backend.iterations)
+        if count != self._last_count:
+            self.estimator.add(monotonic(), count)
+            self.last_stats = format_estimate(
+                self.estimator, self.backend.iterations - count
+            )
+            self._last_count = count
+        return f"{self.backend.generate_bar(count)} | {self.last_stats}"
+
+    def start(self) -> None:
+        self._renderer.start()
+
+    def close(self) -> None:
+        self._renderer.close()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    WORKERS = 8
+    ITEMS = 200_000
+
+    red = color(sRGB(255, 0, 0))
+    green = color(sRGB(0, 255, 0))
+
+    with SharedBar(WORKERS * ITEMS, GradientGenerator(40, Gradient(red, green))) as bar:
+
+        def work() -> None:
+            for _ in range(ITEMS):
+                bar.update()
+
+        with ThreadPoolExecutor(WORKERS) as pool:
+            for _ in range(WORKERS):
+                pool.submit(work)
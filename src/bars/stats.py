@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .estimators import Estimator
+
+
+def format_eta(estimator: "Estimator", remaining: float) -> str:
+    eta = estimator.eta(remaining)
+    return f"{eta:.0f}s" if eta < 999 else "∞"
+
+
+def format_elapsed(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def format_stream_stats(count: int, rate: float, runtime: float) -> str:
+    return f"{count}it | {rate:.1f}it/s | {format_elapsed(runtime)}"
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "kB", "MB", "GB"):
+        if size < 1000:
+            return f"{size:.1f}{unit}"
+        size /= 1000
+    return f"{size:.1f}TB"
+
+
+def format_byte_stats(estimator: "Estimator", remaining: int) -> str:
+    rate = format_bytes(estimator.rate())
+    return f"{rate}/s | ETA {format_eta(estimator, remaining)}"
+
+
+def format_estimate(estimator: "Estimator", remaining: int) -> str:
+    return f"{estimator.rate():.1f}it/s | ETA {format_eta(estimator, remaining)}"
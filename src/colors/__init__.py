@@ -0,0 +1,42 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .color_array import ColorArray
+    from .gradient import Gradient, GradientGenerator
+    from .pallete import Pallete, PalleteGenerator
+    from .static_color import StaticColorGenerator
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "ColorArray": "color_array",
+    "Gradient": "gradient",
+    "GradientGenerator": "gradient",
+    "Pallete": "pallete",
+    "PalleteGenerator": "pallete",
+    "StaticColorGenerator": "static_color",
+}
+
+__all__ = [
+    "ColorArray",
+    "Gradient",
+    "GradientGenerator",
+    "Pallete",
+    "PalleteGenerator",
+    "StaticColorGenerator",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Generators pull in every color space and the interpolation tables, so
+    # they are imported only when one is asked for.
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,339 @@
+from bisect import bisect_left
+from functools import cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
+
+from .color_depth import (
+    CUBE_INDEX,
+    CUBE_LEVELS,
+    GRAY_INDEX,
+    GRAY_LEVELS,
+    ColorDepth,
+    to_xterm256,
+    xterm_to_16,
+)
+from .interpolation import (
+    InterpolationSpace,
+    from_working_array,
+    mix,
+    prepare_stops,
+)
+from .types import (
+    Color,
+    ColorSpace,
+    ColorWithBackground,
+    ColorWithoutBackground,
+    color,
+)
+from .types.color_spaces import sRGB
+from .types.conversions import SCALAR, to_uint8
+
+if TYPE_CHECKING:
+    from .gradient import Gradient
+    from .pallete import Pallete
+
+RGB = tuple[int, int, int]
+
+# Below this many rows NumPy's per-call overhead outweighs vectorization,
+# so typical bar widths never pay for importing it.
+NUMPY_MIN_ROWS = 64
+
+
+@cache
+def _numpy() -> Any:
+    """NumPy, imported by the first large batch instead of at import."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return numpy
+
+
+def _batch_numpy(rows: int) -> Any:
+    return _numpy() if rows >= NUMPY_MIN_ROWS else None
+
+
+def __getattr__(name: str) -> Any:
+    # ``HAS_NUMPY`` is resolved on access so importing this module stays cheap.
+    if name == "HAS_NUMPY":
+        return _numpy() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class ColorArray:
+    """
+    Structure-of-arrays batch of colors.
+
+    ``foreground`` (and the optional ``background``) hold one RGB row per
+    color: an ``(N, 3)`` ``uint8`` array when NumPy is installed and the
+    batch is large enough, otherwise a flat ``bytearray`` of ``3 * N``
+    channels. Either way no ``Color`` or
+    ``sRGB`` object is created until a row is explicitly read back.
+    """
+
+    def __init__(self, foreground: Any, background: Any = None) -> None:
+        self.foreground = foreground
+        self.background = background
+
+    @classmethod
+    def from_rows(
+        cls, foreground: Sequence[RGB], background: Optional[Sequence[RGB]] = None
+    ) -> "ColorArray":
+        return cls(_pack(foreground), None if background is None else _pack(background))
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[Color]) -> "ColorArray":
+        """Pack ``colors``; the background is kept only if every color has one."""
+        colors = list(colors)
+        if colors and all(c.background is not None for c in colors):
+            return cls.from_rows(_rows(colors, False), _rows(colors, True))
+        return cls.from_rows(_rows(colors, False))
+
+    @classmethod
+    def from_space(
+        cls, space: type[ColorSpace], rows: Iterable[Sequence[float]]
+    ) -> "ColorArray":
+        """
+        Convert rows of ``space`` channels (alpha excluded) to sRGB in one
+        call, without building or validating a ``ColorSpace`` per row.
+        Out-of-gamut results are clipped.
+        """
+        rows = list(rows)
+        np = _batch_numpy(len(rows))
+        if np is None:
+            convert = space._convert
+            return cls.from_rows([to_uint8(convert(SCALAR, *row)) for row in rows])
+        columns = np.asarray(rows, dtype=np.float64).T
+        rgb = np.stack(np.broadcast_arrays(*space._convert(np, *columns)), axis=1)
+        return cls(np.rint(np.clip(rgb, 0.0, 1.0) * 255).astype(np.uint8))
+
+    @classmethod
+    def gradient(cls, gradient: "Gradient", count: int) -> "ColorArray":
+        """Vectorized equivalent of ``GradientGenerator(count, gradient)``."""
+        positions = [position for position, _ in gradient.color_positions]
+        stops = [stop for _, stop in gradient.color_positions]
+        ratios = _sample_points(count)
+        space = gradient.space
+        foreground = _interpolate(positions, _rows(stops, False), ratios, space)
+        if all(stop.background is not None for stop in stops):
+            background = _interpolate(positions, _rows(stops, True), ratios, space)
+            return cls(foreground, background)
+        if all(stop.background is None for stop in stops):
+            return cls(foreground)
+        # Mixed stops keep the background of the left stop: no fast path.
+        return cls.from_colors(gradient.get_color_at(t) for t in ratios)
+
+    @classmethod
+    def pallete(
+        cls, pallete: "Pallete", count: int, repeat: bool = False
+    ) -> "ColorArray":
+        """Vectorized equivalent of ``PalleteGenerator(count, pallete, repeat)``."""
+        positions = [position for position, _ in pallete.color_positions]
+        stops = [stop for _, stop in pallete.color_positions]
+        if repeat:
+            indices = [i % len(stops) for i in range(count)]
+        else:
+            indices = [_segment(positions, t) for t in _sample_points(count)]
+        foreground = _rows(stops, False)
+        if all(stop.background is not None for stop in stops):
+            background = _rows(stops, True)
+            return cls.from_rows(
+                [foreground[i] for i in indices], [background[i] for i in indices]
+            )
+        return cls.from_rows([foreground[i] for i in indices])
+
+    def __len__(self) -> int:
+        if isinstance(self.foreground, bytearray):
+            return len(self.foreground) // 3
+        return len(self.foreground)
+
+    def rows(self, background: bool = False) -> list[RGB]:
+        channels = self.background if background else self.foreground
+        if channels is None:
+            raise ValueError("this ColorArray has no background")
+        if not isinstance(channels, bytearray):
+            return [tuple(row) for row in channels.tolist()]
+        it = iter(channels)
+        return list(zip(it, it, it, strict=True))
+
+    def no_background(self) -> "ColorArray":
+        return ColorArray(self.foreground)
+
+    def repeat(self, count: int) -> "ColorArray":
+        """The whole array repeated ``count`` times."""
+        background = None if self.background is None else _tile(self.background, count)
+        return ColorArray(_tile(self.foreground, count), background)
+
+    def __iter__(self) -> Iterator[Color]:
+        """Materialize ``Color`` objects, for code that still needs them."""
+        if self.background is None:
+            for rgb in self.rows():
+                yield ColorWithoutBackground._wrap(sRGB._unchecked(*rgb), None)
+        else:
+            for fg, bg in zip(self.rows(), self.rows(True), strict=True):
+                yield ColorWithBackground._wrap(
+                    sRGB._unchecked(*fg), sRGB._unchecked(*bg)
+                )
+
+    def sgr(self, depth: ColorDepth = "truecolor") -> list[str]:
+        """SGR parameters for every color, matching ``color_depth.sgr``."""
+        if depth == "none":
+            return [""] * len(self)
+        params = _channel_sgr(self.foreground, depth, 30)
+        if self.background is None:
+            return params
+        background = _channel_sgr(self.background, depth, 40)
+        return [f"{fg};{bg}" for fg, bg in zip(params, background, strict=True)]
+
+    def escapes(self, depth: ColorDepth = "truecolor") -> list[str]:
+        """Full ``\\033[...m`` escapes, or empty strings for ``"none"``."""
+        return [f"\033[{params}m" if params else "" for params in self.sgr(depth)]
+
+
+def _pack(rows: Sequence[RGB]) -> Any:
+    np = _batch_numpy(len(rows))
+    if np is not None:
+        return np.array(rows, dtype=np.uint8).reshape(len(rows), 3)
+    return bytearray(channel for row in rows for channel in row)
+
+
+def _tile(channels: Any, count: int) -> Any:
+    if isinstance(channels, bytearray):
+        return channels * count
+    return _numpy().tile(channels, (count, 1))
+
+
+def _rows(colors: list[Color], background: bool) -> list[RGB]:
+    if background:
+        return [c.background.to_rgb() for c in colors if c.background is not None]
+    return [c.foreground.to_rgb() for c in colors]
+
+
+def _sample_points(count: int) -> list[float]:
+    if count == 1:
+        return [0.0]
+    return [i / (count - 1) for i in range(count)]
+
+
+def _segment(positions: list[float], t: float) -> int:
+    """Index of the right-hand stop used for ``t``, as in ``get_color_at``."""
+    if t <= positions[0]:
+        return 0
+    if t >= positions[-1]:
+        return len(positions) - 1
+    return bisect_left(positions, t, 1, len(positions) - 1)
+
+
+def _interpolate(
+    positions: list[float],
+    stops: list[RGB],
+    ratios: list[float],
+    space: InterpolationSpace = "srgb",
+) -> Any:
+    """
+    Piecewise linear interpolation with the same float operations and
+    truncation (or table encoding, outside sRGB) as ``Gradient``, so
+    results match bit for bit.
+    """
+    if len(stops) == 1:
+        return _pack(stops * len(ratios))
+    working = stops if space == "srgb" else prepare_stops(space, stops)
+    np = _batch_numpy(len(ratios))
+    if np is not None:
+        t = np.array(ratios)
+        xp = np.array(positions)
+        colors = np.array(working, dtype=np.float64)
+        right = np.clip(np.searchsorted(xp, t, side="left"), 1, len(xp) - 1)
+        left = right - 1
+        span = xp[right] - xp[left]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(span == 0, 1.0, (t - xp[left]) / span)[:, None]
+        values = colors[left] * (1 - ratio) + colors[right] * ratio
+        if space == "srgb":
+            rgb = np.trunc(values).astype(np.uint8)
+        else:
+            rgb = from_working_array(space, values)
+        rgb[t >= xp[-1]] = stops[-1]
+        rgb[t <= xp[0]] = stops[0]
+        return rgb
+
+    out = bytearray()
+    for t in ratios:
+        right = _segment(positions, t)
+        if right == 0 or t >= positions[-1]:
+            out.extend(stops[right])
+            continue
+        pos0, pos1 = positions[right - 1], positions[right]
+        if pos1 == pos0:
+            out.extend(stops[right])
+            continue
+        ratio = (t - pos0) / (pos1 - pos0)
+        if space != "srgb":
+            out.extend(mix(space, working[right - 1], working[right], ratio))
+            continue
+        for lo, hi in zip(stops[right - 1], stops[right], strict=True):
+            out.append(int(lo * (1 - ratio) + hi * ratio))
+    return out
+
+
+def _channel_sgr(channels: Any, depth: ColorDepth, base: int) -> list[str]:
+    if depth == "truecolor":
+        if isinstance(channels, bytearray):
+            rows = _flat_rows(channels)
+        else:
+            rows = channels.tolist()
+        return [f"{base + 8};2;{r};{g};{b}" for r, g, b in rows]
+
+    indices = _xterm256(channels)
+    if depth == "256":
+        return [f"{base + 8};5;{index}" for index in indices]
+    table = xterm_to_16()
+    codes = [table[index] for index in indices]
+    return [str(base + c if c < 8 else base + 60 + c - 8) for c in codes]
+
+
+def _flat_rows(channels: bytearray) -> Iterator[tuple[int, ...]]:
+    it = iter(channels)
+    return zip(it, it, it, strict=True)
+
+
+def _xterm256(channels: Any) -> list[int]:
+    """Bulk ``to_xterm256`` over every row."""
+    if isinstance(channels, bytearray):
+        return [to_xterm256(*row) for row in _flat_rows(channels)]
+
+    np = _numpy()
+    levels = np.array(CUBE_LEVELS, dtype=np.int32)
+    rgb = channels.astype(np.int32)
+    cube = np.frombuffer(CUBE_INDEX, dtype=np.uint8)[channels]
+    cube_rgb = levels[cube]
+    gray_step = np.frombuffer(GRAY_INDEX, dtype=np.uint8)[rgb.sum(axis=1) // 3]
+    gray = np.array(GRAY_LEVELS, dtype=np.int32)[gray_step]
+    cube_distance = ((cube_rgb - rgb) ** 2).sum(axis=1)
+    gray_distance = ((gray[:, None] - rgb) ** 2).sum(axis=1)
+    cube = cube.astype(np.int32)
+    cube_index = 16 + 36 * cube[:, 0] + 6 * cube[:, 1] + cube[:, 2]
+    return np.where(gray_distance < cube_distance, 232 + gray_step, cube_index).tolist()
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    from .gradient import Gradient, GradientGenerator
+
+    red = color(sRGB(255, 0, 0))
+    green = color(sRGB(0, 255, 0))
+    blue = color(sRGB(0, 0, 255))
+    gradient = Gradient(red, green, blue)
+
+    print(f"NumPy: {_numpy() is not None}")
+    for count in (50, 1_000, 100_000):
+        start = perf_counter()
+        objects = [str(c) for c in GradientGenerator(count, gradient)]
+        middle = perf_counter()
+        batch = ColorArray.gradient(gradient, count).sgr()
+        end = perf_counter()
+        assert objects == batch
+        print(
+            f"{count:>7} colors: objects {middle - start:.4f}s, "
+            f"ColorArray {end - middle:.4f}s"
+        )
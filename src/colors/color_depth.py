@@ -0,0 +1,188 @@
+import os
+from functools import cache, lru_cache
+from typing import Any, Literal, Mapping
+
+from .types import Color, color
+from .types.color_spaces import sRGB
+
+ColorDepth = Literal["truecolor", "256", "16", "none"]
+COLOR_DEPTHS: tuple[ColorDepth, ...] = ("truecolor", "256", "16", "none")
+
+# Terminals that only understand the 16 system colors.
+LIMITED_TERMS = frozenset(
+    {"ansi", "cons25", "cygwin", "linux", "vt100", "vt220", "xterm-16color"}
+)
+
+# xterm 256-color palette: 16 system colors, a 6x6x6 cube and 24 grays.
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+GRAY_LEVELS = tuple(8 + 10 * i for i in range(24))
+ANSI_16 = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+
+def _nearest(levels: tuple[int, ...], value: int) -> int:
+    return min(range(len(levels)), key=lambda i: abs(levels[i] - value))
+
+
+def _distance(left: tuple[int, int, int], right: tuple[int, int, int]) -> int:
+    return sum((a - b) ** 2 for a, b in zip(left, right, strict=True))
+
+
+def _xterm_rgb(index: int) -> tuple[int, int, int]:
+    if index < 16:
+        return ANSI_16[index]
+    if index >= 232:
+        gray = GRAY_LEVELS[index - 232]
+        return (gray, gray, gray)
+    index -= 16
+    return (
+        CUBE_LEVELS[index // 36],
+        CUBE_LEVELS[index // 6 % 6],
+        CUBE_LEVELS[index % 6],
+    )
+
+
+# Per-channel nearest cube/gray step.
+CUBE_INDEX = bytes(_nearest(CUBE_LEVELS, value) for value in range(256))
+GRAY_INDEX = bytes(_nearest(GRAY_LEVELS, value) for value in range(256))
+
+
+def _nearest_ansi(rgb: tuple[int, int, int]) -> int:
+    return min(range(16), key=lambda i: _distance(ANSI_16[i], rgb))
+
+
+@cache
+def xterm_to_16() -> bytes:
+    """Nearest of the 16 system colors for every 256-palette entry."""
+    return bytes(_nearest_ansi(_xterm_rgb(index)) for index in range(256))
+
+
+def __getattr__(name: str) -> Any:
+    # Only 16-color output needs this table, so it is built on first use.
+    if name == "XTERM_TO_16":
+        return xterm_to_16()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=4096)
+def to_xterm256(red: int, green: int, blue: int) -> int:
+    """Nearest xterm 256-palette index, from the cube or the gray ramp."""
+    r, g, b = CUBE_INDEX[red], CUBE_INDEX[green], CUBE_INDEX[blue]
+    cube_rgb = (CUBE_LEVELS[r], CUBE_LEVELS[g], CUBE_LEVELS[b])
+
+    gray_step = GRAY_INDEX[(red + green + blue) // 3]
+    gray = GRAY_LEVELS[gray_step]
+    rgb = (red, green, blue)
+    if _distance((gray, gray, gray), rgb) < _distance(cube_rgb, rgb):
+        return 232 + gray_step
+    return 16 + 36 * r + 6 * g + b
+
+
+def to_ansi16(red: int, green: int, blue: int) -> int:
+    """Nearest of the 16 system colors, through the 256-color lookup."""
+    return xterm_to_16()[to_xterm256(red, green, blue)]
+
+
+def detect_color_depth(environ: Mapping[str, str] = os.environ) -> ColorDepth:
+    """
+    Guess the terminal color depth from ``NO_COLOR``, ``COLORTERM`` and
+    ``TERM``. Without any hint, or for a terminal not known to be limited,
+    the bars keep their 24-bit output.
+    """
+    if environ.get("NO_COLOR"):
+        return "none"
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return "truecolor"
+    term = environ.get("TERM", "").lower()
+    if not term:
+        return "truecolor"
+    if term == "dumb":
+        return "none"
+    if any(name in term for name in ("direct", "truecolor", "kitty", "alacritty")):
+        return "truecolor"
+    if "256color" in term:
+        return "256"
+    if term in LIMITED_TERMS:
+        return "16"
+    return "truecolor"
+
+
+@cache
+def default_color_depth() -> ColorDepth:
+    """Color depth detected once per process."""
+    return detect_color_depth()
+
+
+def resolve_color_depth(depth: ColorDepth | Literal["auto"]) -> ColorDepth:
+    if depth == "auto":
+        return default_color_depth()
+    if depth not in COLOR_DEPTHS:
+        raise ValueError(f"unknown color depth: {depth!r}")
+    return depth
+
+
+def _channel_sgr(rgb: tuple[int, int, int], depth: ColorDepth, base: int) -> str:
+    """SGR parameters for one foreground (``base=30``) or background (40) color."""
+    if depth == "truecolor":
+        return f"{base + 8};2;{rgb[0]};{rgb[1]};{rgb[2]}"
+    if depth == "256":
+        return f"{base + 8};5;{to_xterm256(*rgb)}"
+    index = to_ansi16(*rgb)
+    return str(base + index if index < 8 else base + 60 + index - 8)
+
+
+def sgr(color: Color, depth: ColorDepth = "truecolor") -> str:
+    """
+    SGR parameters for ``color`` quantized to ``depth``; empty for ``"none"``.
+    ``sgr(color)`` is the same as ``str(color)``.
+    """
+    if depth == "none":
+        return ""
+    if depth == "truecolor":
+        return str(color)
+    params = _channel_sgr(color.foreground.to_rgb(), depth, 30)
+    if color.background is not None:
+        params += ";" + _channel_sgr(color.background.to_rgb(), depth, 40)
+    return params
+
+
+def escape(color: Color, depth: ColorDepth = "truecolor") -> str:
+    """Full ``\\033[...m`` escape for ``color``, or ``""`` for ``"none"``."""
+    params = sgr(color, depth)
+    return f"\033[{params}m" if params else ""
+
+
+def reset(depth: ColorDepth = "truecolor") -> str:
+    """SGR reset closing a colored frame, or ``""`` for ``"none"``."""
+    return "" if depth == "none" else "\033[0m"
+
+
+if __name__ == "__main__":
+    samples = [
+        color(sRGB(255, 0, 0)),
+        color(sRGB(255, 128, 0), sRGB(20, 20, 20)),
+        color(sRGB(90, 90, 90)),
+        color(sRGB(30, 144, 255)),
+    ]
+
+    print(f"Detected: {default_color_depth()}")
+    for depth in COLOR_DEPTHS:
+        cells = "".join(f"{escape(sample, depth)}████\033[0m" for sample in samples)
+        params = [sgr(sample, depth) for sample in samples]
+        print(f"{depth:>9} {cells} {params}")
@@ -1,11 +1,14 @@
-from typing import Generic, Iterator
+from typing import Generic, Hashable, Iterator, Optional
 
+from .color_array import ColorArray
+from .interpolation import InterpolationSpace, check_space, mix, prepare_stops
 from .types import (
     ColorGenerator,
     ColorType,
     ColorWithBackground,
     ColorWithoutBackground,
     Float01,
+    color_key,
 )
 from .types.color_spaces import sRGB
 
@@ -15,7 +18,13 @@ class Gradient(Generic[ColorType]):
         self,
         *colors: ColorType,
         positions: list[Float01] | None = None,
+        space: InterpolationSpace = "srgb",
     ) -> None:
+        """
+        ``space`` picks where stops are mixed: ``"srgb"`` lerps the bytes
+        as before, ``"linear"`` mixes light, and ``"oklab"``/``"oklch"``
+        give perceptually even steps without muddy midpoints.
+        """
         if positions is None:
             _positions = [i / (len(colors) - 1) for i in range(len(colors))]
         else:
@@ -25,6 +34,22 @@ class Gradient(Generic[ColorType]):
         self.color_positions: list[tuple[float, ColorType]] = sorted(
             zip(_positions, colors, strict=True), key=lambda x: x[0]
         )
+        self.space: InterpolationSpace = check_space(space)
+        if self.space != "srgb":
+            stops = [stop for _, stop in self.color_positions]
+            foreground = prepare_stops(
+                self.space, [stop.foreground.to_rgb() for stop in stops]
+            )
+            background = iter(
+                prepare_stops(
+                    self.space,
+                    [s.background.to_rgb() for s in stops if s.background is not None],
+                )
+            )
+            self._working = [
+                (fg, None if stop.background is None else next(background))
+                for fg, stop in zip(foreground, stops, strict=True)
+            ]
 
     def __len__(self) -> int:
         return len(self.color_positions)
@@ -56,7 +81,23 @@ class Gradient(Generic[ColorType]):
             return color1
         ratio = (t - pos0) / (pos1 - pos0)
 
-        return color0.interpolate(color1, ratio)
+        if self.space == "srgb":
+            return color0.interpolate(color1, ratio)
+        return self._mix(lo, ratio)
+
+    def _mix(self, index: int, ratio: float) -> ColorType:
+        """Mix stops ``index - 1`` and ``index`` in the interpolation space."""
+        color0 = self.color_positions[index - 1][1]
+        fg0, bg0 = self._working[index - 1]
+        fg1, bg1 = self._working[index]
+        foreground = sRGB._unchecked(*mix(self.space, fg0, fg1, ratio))
+        if color0.background is None:
+            background = None
+        elif bg0 is None or bg1 is None:
+            background = sRGB._unchecked(*color0.background.to_rgb())
+        else:
+            background = sRGB._unchecked(*mix(self.space, bg0, bg1, ratio))
+        return type(color0)._wrap(foreground, background)
 
 
 class GradientGenerator(ColorGenerator, Generic[ColorType]):
@@ -81,6 +122,13 @@ class GradientGenerator(ColorGenerator, Generic[ColorType]):
             t = i / (self._count - 1)
             yield self._gradient.get_color_at(t)
 
+    def cache_key(self) -> Optional[Hashable]:
+        stops = tuple((pos, color_key(c)) for pos, c in self._gradient.color_positions)
+        return ("gradient", self._count, self._gradient.space, stops)
+
+    def to_array(self) -> ColorArray:
+        return ColorArray.gradient(self._gradient, self._count)
+
 
 if __name__ == "__main__":
     red_on_black = ColorWithBackground(sRGB(255, 0, 0), sRGB(0, 0, 0))
@@ -95,3 +143,9 @@ if __name__ == "__main__":
 
     for i, color in enumerate(GradientGenerator(10, gradient_no_bg)):
         print(f"\033[{color}m{'█' * 40} t={i:.1f} \033[0m")
+
+    blue = ColorWithoutBackground(sRGB(0, 0, 255))
+    yellow = ColorWithoutBackground(sRGB(255, 255, 0))
+    for space in ("srgb", "linear", "oklab", "oklch"):
+        cells = GradientGenerator(60, Gradient(blue, yellow, space=space))
+        print("".join(f"\033[{color}m█" for color in cells) + f"\033[0m {space}")
@@ -0,0 +1,143 @@
+import math
+from functools import cache
+from typing import Any, Literal, Sequence
+
+from .types.conversions import (
+    LMS_TO_LINEAR_SRGB,
+    OKLAB_TO_LMS,
+    SCALAR,
+    Matrix,
+    srgb_decode,
+    srgb_encode,
+    transform,
+)
+
+InterpolationSpace = Literal["srgb", "linear", "oklab", "oklch"]
+INTERPOLATION_SPACES: tuple[InterpolationSpace, ...] = (
+    "srgb",
+    "linear",
+    "oklab",
+    "oklch",
+)
+
+RGB = tuple[int, int, int]
+Coords = tuple[float, float, float]
+
+LINEAR_SRGB_TO_LMS: Matrix = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+LMS_TO_OKLAB: Matrix = (
+    (0.2104542553, 0.793617785, -0.0040720468),
+    (1.9779984951, -2.428592205, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.808675766),
+)
+
+# sRGB byte -> linear light, and linear light sampled ENCODE_STEPS times
+# back to bytes: fine enough that every byte survives the round trip.
+DECODE = tuple(srgb_decode(SCALAR, value / 255) for value in range(256))
+ENCODE_STEPS = 1 << 14
+
+# Below this chroma the hue of an Oklch color is meaningless.
+ACHROMATIC = 1e-4
+
+
+def check_space(space: str) -> InterpolationSpace:
+    if space not in INTERPOLATION_SPACES:
+        raise ValueError(f"unknown interpolation space: {space!r}")
+    return space
+
+
+@cache
+def encode_table() -> bytes:
+    """Built on the first perceptual gradient, not at import."""
+    return bytes(
+        round(srgb_encode(SCALAR, step / ENCODE_STEPS) * 255)
+        for step in range(ENCODE_STEPS + 1)
+    )
+
+
+def to_working(space: InterpolationSpace, rgb: RGB) -> Coords:
+    """Coordinates of an sRGB color in ``space`` (Oklch hue in radians)."""
+    linear = (DECODE[rgb[0]], DECODE[rgb[1]], DECODE[rgb[2]])
+    if space == "linear":
+        return linear
+    # Long, medium and short cone responses; L is the Oklab lightness.
+    long, medium, short = transform(LINEAR_SRGB_TO_LMS, *linear)
+    L, a, b = transform(
+        LMS_TO_OKLAB, math.cbrt(long), math.cbrt(medium), math.cbrt(short)
+    )
+    if space == "oklab":
+        return (L, a, b)
+    return (L, math.hypot(a, b), math.atan2(b, a))
+
+
+def prepare_stops(space: InterpolationSpace, stops: Sequence[RGB]) -> list[Coords]:
+    """
+    Convert gradient stops once. Oklch hues are unwrapped so that a plain
+    lerp between neighbours takes the shorter arc, and gray stops borrow
+    the hue of a neighbour instead of swinging through red.
+    """
+    coords = [to_working(space, rgb) for rgb in stops]
+    if space != "oklch":
+        return coords
+
+    chromatic = [i for i, (_, chroma, _) in enumerate(coords) if chroma > ACHROMATIC]
+    if not chromatic:
+        return coords
+    hue = coords[chromatic[0]][2]
+    prepared = []
+    for L, chroma, h in coords:
+        if chroma > ACHROMATIC:
+            h += 2 * math.pi * round((hue - h) / (2 * math.pi))
+            hue = h
+        prepared.append((L, chroma, hue))
+    return prepared
+
+
+def _linear(xp: Any, space: InterpolationSpace, x: Any, y: Any, z: Any) -> Any:
+    if space == "linear":
+        return (x, y, z)
+    if space == "oklch":
+        x, y, z = x, y * xp.cos(z), y * xp.sin(z)
+    long, medium, short = transform(OKLAB_TO_LMS, x, y, z)
+    return transform(
+        LMS_TO_LINEAR_SRGB,
+        long * long * long,
+        medium * medium * medium,
+        short * short * short,
+    )
+
+
+def _step(value: float) -> int:
+    return min(max(int(value * ENCODE_STEPS + 0.5), 0), ENCODE_STEPS)
+
+
+def from_working(space: InterpolationSpace, coords: Sequence[float]) -> RGB:
+    """sRGB bytes for ``coords``, clipped to the gamut by the encode table."""
+    r, g, b = _linear(SCALAR, space, *coords)
+    table = encode_table()
+    return (table[_step(r)], table[_step(g)], table[_step(b)])
+
+
+def from_working_array(space: InterpolationSpace, values: Any) -> Any:
+    """Vectorized :func:`from_working` over an ``(N, 3)`` float array."""
+    import numpy as np
+
+    table = np.frombuffer(encode_table(), dtype=np.uint8)
+    linear = np.stack(_linear(np, space, *values.T), axis=1)
+    steps = np.clip(linear * ENCODE_STEPS + 0.5, 0, ENCODE_STEPS)
+    return table[steps.astype(np.intp)]
+
+
+def mix(space: InterpolationSpace, left: Coords, right: Coords, ratio: float) -> RGB:
+    inverse = 1 - ratio
+    return from_working(
+        space,
+        (
+            left[0] * inverse + right[0] * ratio,
+            left[1] * inverse + right[1] * ratio,
+            left[2] * inverse + right[2] * ratio,
+        ),
+    )
@@ -1,10 +1,12 @@
-from typing import Generic, Iterator
+from typing import Generic, Hashable, Iterator, Optional
 
+from .color_array import ColorArray
 from .types import (
     ColorGenerator,
     ColorType,
     Float01,
     color,
+    color_key,
 )
 from .types.color_spaces import sRGB
 
@@ -84,6 +86,13 @@ class PalleteGenerator(ColorGenerator, Generic[ColorType]):
             for i in range(self._count):
                 yield self._pallete.color_positions[i % len(self._pallete)][1]
 
+    def cache_key(self) -> Optional[Hashable]:
+        stops = tuple((pos, color_key(c)) for pos, c in self._pallete.color_positions)
+        return ("pallete", self._count, self.repeat, stops)
+
+    def to_array(self) -> ColorArray:
+        return ColorArray.pallete(self._pallete, self._count, self.repeat)
+
 
 if __name__ == "__main__":
     red_on_black = color(sRGB(255, 0, 0), sRGB(0, 0, 0))
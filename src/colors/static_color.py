@@ -1,7 +1,8 @@
-from typing import Generic, Iterator
+from typing import Generic, Hashable, Iterator, Optional
 
-from src.colors.types.color import ColorType, color
+from src.colors.types.color import ColorType, color, color_key
 
+from .color_array import ColorArray
 from .types import ColorGenerator
 from .types.color_spaces import sRGB
 
@@ -24,6 +25,12 @@ class StaticColorGenerator(ColorGenerator, Generic[ColorType]):
         for _ in range(self._count):
             yield self._color
 
+    def cache_key(self) -> Optional[Hashable]:
+        return ("static", self._count, color_key(self._color))
+
+    def to_array(self) -> ColorArray:
+        return ColorArray.from_colors([self._color]).repeat(self._count)
+
 
 if __name__ == "__main__":
     red_on_black = color(sRGB(255, 0, 0), sRGB(0, 0, 0))
@@ -1,5 +1,12 @@
 from . import color_spaces, exceptions, validators
-from .color import Color, ColorType, ColorWithBackground, ColorWithoutBackground, color
+from .color import (
+    Color,
+    ColorType,
+    ColorWithBackground,
+    ColorWithoutBackground,
+    color,
+    color_key,
+)
 from .color_generator import ColorGenerator
 from .color_space import ColorSpace
 from .numeric import (
@@ -21,6 +28,7 @@ __all__ = [
     "exceptions",
     "color_spaces",
     "color",
+    "color_key",
     "Color",
     "ColorWithoutBackground",
     "ColorWithBackground",
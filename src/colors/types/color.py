@@ -1,11 +1,16 @@
 from abc import abstractmethod
-from typing import Optional, TypeVar, overload
+from typing import Hashable, Optional, Self, TypeVar, overload
 
 from src.colors.types.color_space import ColorSpace
 from src.colors.types.color_spaces import sRGB
 
 
 class Color:
+    # ``_sgr`` and ``_bytes`` cache the rendered color. They stay valid while
+    # ``_fg_part``/``_bg_part`` are the very strings the channels render to,
+    # which changes whenever a channel setter runs or a channel is replaced.
+    __slots__ = ("foreground", "background", "_sgr", "_bytes", "_fg_part", "_bg_part")
+
     foreground: sRGB
     background: Optional[sRGB]
 
@@ -17,66 +22,122 @@ class Color:
     def interpolate(self, other: "Color", ratio: float) -> "Color":
         raise NotImplementedError
 
+    def __bytes__(self) -> bytes:
+        """``str(self)`` encoded, cached alongside it."""
+        sgr = str(self)
+        cached = self._bytes
+        if cached is None:
+            cached = self._bytes = sgr.encode("ascii")
+        return cached
+
+    @classmethod
+    def _wrap(cls, foreground: sRGB, background: Optional[sRGB]) -> Self:
+        """Build around ``sRGB`` instances the caller owns, without copying."""
+        color = cls.__new__(cls)
+        color.foreground = foreground
+        color.background = background
+        color._fg_part = color._bg_part = None
+        return color
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.foreground == other.foreground
+            and self.background == other.background
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.foreground, self.background))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.foreground!r}, {self.background!r})"
+
+
+def _copy(space: ColorSpace) -> sRGB:
+    """Opaque sRGB copy; an sRGB source is already in range."""
+    if isinstance(space, sRGB):
+        return sRGB._unchecked(*space.to_rgb())
+    return sRGB(*space.to_rgb())
+
+
+def _lerp(left: sRGB, right: sRGB, ratio: float) -> sRGB:
+    red, green, blue = left.to_rgb()
+    other_red, other_green, other_blue = right.to_rgb()
+    inverse = 1 - ratio
+    # A lerp within [0, 1] stays in range; extrapolation is still validated.
+    build = sRGB._unchecked if 0.0 <= ratio <= 1.0 else sRGB
+    return build(
+        int(red * inverse + other_red * ratio),
+        int(green * inverse + other_green * ratio),
+        int(blue * inverse + other_blue * ratio),
+    )
+
 
 class ColorWithoutBackground(Color):
+    __slots__ = ()
+
     def __init__(self, foreground: ColorSpace) -> None:
-        self.foreground: sRGB = sRGB(*foreground.to_rgb())
+        self.foreground: sRGB = _copy(foreground)
         self.background = None
+        self._fg_part = self._bg_part = None
 
     def __str__(self) -> str:
-        fg = str(self.foreground)
-        return f"38;{fg}"
+        fg = self.foreground._sgr or str(self.foreground)
+        if fg is not self._fg_part:
+            self._fg_part = fg
+            self._sgr = f"38;{fg}"
+            self._bytes = None
+        return self._sgr
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.foreground!r})"
 
     def interpolate(self, other: Color, ratio: float) -> "ColorWithoutBackground":
-        new_foreground: sRGB = sRGB(
-            *(
-                int(left * (1 - ratio) + right * ratio)
-                for left, right in zip(
-                    self.foreground.to_rgb(), other.foreground.to_rgb(), strict=True
-                )
-            )
+        return ColorWithoutBackground._wrap(
+            _lerp(self.foreground, other.foreground, ratio), None
         )
-        return ColorWithoutBackground(new_foreground)
 
 
 class ColorWithBackground(Color):
+    __slots__ = ()
+
     def __init__(self, foreground: ColorSpace, background: ColorSpace) -> None:
-        self.foreground: sRGB = sRGB(*foreground.to_rgb())
-        self.background: sRGB = sRGB(*background.to_rgb())
+        self.foreground: sRGB = _copy(foreground)
+        self.background: sRGB = _copy(background)
+        self._fg_part = self._bg_part = None
 
     def __str__(self) -> str:
-        fg = str(self.foreground)
-        bg = str(self.background)
-        return f"38;{fg};48;{bg}"
+        fg = self.foreground._sgr or str(self.foreground)
+        bg = self.background._sgr or str(self.background)
+        if fg is not self._fg_part or bg is not self._bg_part:
+            self._fg_part = fg
+            self._bg_part = bg
+            self._sgr = f"38;{fg};48;{bg}"
+            self._bytes = None
+        return self._sgr
 
     def interpolate(self, other: Color, ratio: float) -> "ColorWithBackground":
-        new_foreground: sRGB = sRGB(
-            *(
-                int(left * (1 - ratio) + right * ratio)
-                for left, right in zip(
-                    self.foreground.to_rgb(), other.foreground.to_rgb(), strict=True
-                )
-            )
-        )
         new_background: sRGB = (
-            sRGB(
-                *(
-                    int(left * (1 - ratio) + right * ratio)
-                    for left, right in zip(
-                        self.background.to_rgb(), other.background.to_rgb(), strict=True
-                    )
-                )
-            )
+            _lerp(self.background, other.background, ratio)
             if other.background is not None
-            else self.background
+            else _copy(self.background)
+        )
+        return ColorWithBackground._wrap(
+            _lerp(self.foreground, other.foreground, ratio), new_background
         )
-
-        return ColorWithBackground(new_foreground, new_background)
 
 
 ColorType = TypeVar("ColorType", ColorWithoutBackground, ColorWithBackground)
 
 
+def color_key(color: Color) -> Hashable:
+    """Hashable value identifying how ``color`` renders."""
+    background = None if color.background is None else color.background.to_rgb()
+    return (color.foreground.to_rgb(), background)
+
+
 @overload
 def color(foreground: ColorSpace) -> ColorWithoutBackground: ...
 @overload
@@ -84,9 +145,8 @@ def color(foreground: ColorSpace, background: ColorSpace) -> ColorWithBackground
 
 
 def color(foreground: ColorSpace, background: Optional[ColorSpace] = None) -> Color:
-    fg = sRGB.from_color(foreground)
+    # The constructors copy the channels, so no intermediate sRGB is needed.
     if background is None:
-        return ColorWithoutBackground(fg)
+        return ColorWithoutBackground(foreground)
     else:
-        bg = sRGB.from_color(background)
-        return ColorWithBackground(fg, bg)
+        return ColorWithBackground(foreground, background)
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Iterator
+from typing import TYPE_CHECKING, Generic, Hashable, Iterator, Optional
 
 from .color import ColorType, ColorWithoutBackground
 
+if TYPE_CHECKING:
+    from ..color_array import ColorArray
+
 
 class ColorGenerator(ABC, Generic[ColorType]):
     @abstractmethod
@@ -20,6 +23,22 @@ class ColorGenerator(ABC, Generic[ColorType]):
         """
         return ForegroundOnlyGenerator(self)
 
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Hashable description of every color this generator yields, used to
+        share frame tables between identical bars. ``None`` opts out.
+        """
+        return None
+
+    def to_array(self) -> "ColorArray":
+        """
+        Every color packed in a :class:`ColorArray`. Subclasses override this
+        with a batch path that never builds per-cell ``Color`` objects.
+        """
+        from ..color_array import ColorArray
+
+        return ColorArray.from_colors(self)
+
 
 class ForegroundOnlyGenerator(ColorGenerator[ColorWithoutBackground]):
     def __init__(self, generator: ColorGenerator) -> None:
@@ -32,3 +51,10 @@ class ForegroundOnlyGenerator(ColorGenerator[ColorWithoutBackground]):
         for color in self._generator:
             # Extract foreground and wrap as ColorWithoutBackground
             yield ColorWithoutBackground(color.foreground)
+
+    def cache_key(self) -> Optional[Hashable]:
+        key = self._generator.cache_key()
+        return None if key is None else ("foreground", key)
+
+    def to_array(self) -> "ColorArray":
+        return self._generator.to_array().no_background()
@@ -1,14 +1,33 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Tuple
+from typing import Any, Callable, ClassVar, Tuple
 
 from .numeric import Float01, Uint8
 
 
-@dataclass
 class ColorSpace(ABC):
+    # Written out rather than generated by ``@dataclass``: importing
+    # ``dataclasses`` pulls in ``inspect`` and doubles the import time.
+    __slots__ = ()
+    __match_args__ = ("alpha",)
+
     alpha: Float01
 
+    # Channels (alpha excluded) -> encoded sRGB, see ``conversions.py``.
+    _convert: ClassVar[Callable[..., tuple[Any, Any, Any]]]
+
+    def __init__(self, alpha: Float01) -> None:
+        self.alpha = alpha
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(alpha={self.alpha!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ColorSpace) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.alpha == other.alpha
+
     @abstractmethod
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
         raise NotImplementedError
@@ -1,8 +1,28 @@
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 from src.colors.utils.get_setter_decorator import channel_getter_setter
 
 from .color_space import ColorSpace
+from .conversions import (
+    SCALAR,
+    a98_rgb_to_srgb,
+    cielab_to_srgb,
+    cmyk_to_srgb,
+    display_p3_to_srgb,
+    hsl_to_srgb,
+    hsv_to_srgb,
+    hwb_to_srgb,
+    lch_to_srgb,
+    linear_srgb_to_srgb,
+    oklab_to_srgb,
+    oklch_to_srgb,
+    prophoto_rgb_to_srgb,
+    rec2020_to_srgb,
+    srgb_to_srgb,
+    to_uint8,
+    xyz_d50_to_srgb,
+    xyz_d65_to_srgb,
+)
 from .numeric import (
     Float01,
     Float8,
@@ -39,19 +59,55 @@ from .validators import (
 @channel_getter_setter("blue", validate_uint8)
 @channel_getter_setter("alpha", validate_float01)
 class sRGB(ColorSpace):
+    # Compared and hashed by value; don't mutate an instance used as a key.
+    __slots__ = ("_red", "_green", "_blue", "_alpha", "_sgr")
+    # SGR fragment, reset by the generated setters when a channel changes.
+    _caches = ("_sgr",)
+
     def __init__(self, r: Uint8, g: Uint8, b: Uint8, a: Float01 = 1.0) -> None:
         self.red = r
         self.green = g
         self.blue = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        # Generated by channel_getter_setter.
+        @classmethod
+        def _unchecked(
+            cls, r: Uint8, g: Uint8, b: Uint8, a: Float01 = 1.0
+        ) -> "sRGB": ...
+
     @classmethod
     def from_color(cls, color: ColorSpace) -> "sRGB":
         rgb = color.to_rgb()
         return cls(*rgb, color.alpha)
 
+    _convert = staticmethod(srgb_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        return (self.red, self.green, self.blue)
+        return (self._red, self._green, self._blue)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, sRGB):
+            return NotImplemented
+        return (
+            self._red == other._red
+            and self._green == other._green
+            and self._blue == other._blue
+            and self._alpha == other._alpha
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._red, self._green, self._blue, self._alpha))
+
+    def __repr__(self) -> str:
+        return f"sRGB({self._red}, {self._green}, {self._blue}, {self._alpha})"
+
+    def __str__(self) -> str:
+        sgr = self._sgr
+        if sgr is None:
+            sgr = self._sgr = f"2;{self._red};{self._green};{self._blue}"
+        return sgr
 
 
 @channel_getter_setter("hue", validate_float360)
@@ -65,8 +121,16 @@ class HSV(ColorSpace):
         self.value = v
         self.alpha = a
 
+    if TYPE_CHECKING:
+        # Slots written by the accessors channel_getter_setter generates.
+        _hue: Float360
+        _saturation: Float01
+        _value: Float01
+
+    _convert = staticmethod(hsv_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(hsv_to_srgb(SCALAR, self._hue, self._saturation, self._value))
 
 
 @channel_getter_setter("hue", validate_float360)
@@ -80,8 +144,17 @@ class HSL(ColorSpace):
         self.lightness = L
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _hue: Float360
+        _saturation: Float01
+        _lightness: Float01
+
+    _convert = staticmethod(hsl_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(
+            hsl_to_srgb(SCALAR, self._hue, self._saturation, self._lightness)
+        )
 
 
 @channel_getter_setter("hue", validate_float360)
@@ -95,8 +168,17 @@ class HWB(ColorSpace):
         self.blackness = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _hue: Float360
+        _whiteness: Float01
+        _blackness: Float01
+
+    _convert = staticmethod(hwb_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(
+            hwb_to_srgb(SCALAR, self._hue, self._whiteness, self._blackness)
+        )
 
 
 @channel_getter_setter("red", validate_uint8)
@@ -110,8 +192,15 @@ class DisplayP3(ColorSpace):
         self.blue = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _red: Uint8
+        _green: Uint8
+        _blue: Uint8
+
+    _convert = staticmethod(display_p3_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(display_p3_to_srgb(SCALAR, self._red, self._green, self._blue))
 
 
 @channel_getter_setter("red", validate_uint8)
@@ -125,8 +214,15 @@ class Rec2020(ColorSpace):
         self.blue = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _red: Uint8
+        _green: Uint8
+        _blue: Uint8
+
+    _convert = staticmethod(rec2020_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(rec2020_to_srgb(SCALAR, self._red, self._green, self._blue))
 
 
 @channel_getter_setter("red", validate_uint8)
@@ -140,8 +236,15 @@ class A98RGB(ColorSpace):
         self.blue = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _red: Uint8
+        _green: Uint8
+        _blue: Uint8
+
+    _convert = staticmethod(a98_rgb_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(a98_rgb_to_srgb(SCALAR, self._red, self._green, self._blue))
 
 
 @channel_getter_setter("red", validate_uint8)
@@ -155,8 +258,17 @@ class ProPhotoRGB(ColorSpace):
         self.blue = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _red: Uint8
+        _green: Uint8
+        _blue: Uint8
+
+    _convert = staticmethod(prophoto_rgb_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(
+            prophoto_rgb_to_srgb(SCALAR, self._red, self._green, self._blue)
+        )
 
 
 @channel_getter_setter("lightness", validate_float100)
@@ -170,8 +282,17 @@ class CIELAB(ColorSpace):
         self.b_channel = b
         self.alpha = alpha
 
+    if TYPE_CHECKING:
+        _lightness: Float100
+        _a_channel: Float8
+        _b_channel: Float8
+
+    _convert = staticmethod(cielab_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(
+            cielab_to_srgb(SCALAR, self._lightness, self._a_channel, self._b_channel)
+        )
 
 
 @channel_getter_setter("lightness", validate_float100)
@@ -185,8 +306,15 @@ class LCH(ColorSpace):
         self.hue = h
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _lightness: Float100
+        _chroma: Float100
+        _hue: Float360
+
+    _convert = staticmethod(lch_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(lch_to_srgb(SCALAR, self._lightness, self._chroma, self._hue))
 
 
 @channel_getter_setter("lightness", validate_float100)
@@ -202,8 +330,17 @@ class Oklab(ColorSpace):
         self.b_channel = b
         self.alpha = alpha
 
+    if TYPE_CHECKING:
+        _lightness: Float100
+        _a_channel: FloatOklab
+        _b_channel: FloatOklab
+
+    _convert = staticmethod(oklab_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(
+            oklab_to_srgb(SCALAR, self._lightness, self._a_channel, self._b_channel)
+        )
 
 
 @channel_getter_setter("lightness", validate_float100)
@@ -219,8 +356,15 @@ class Oklch(ColorSpace):
         self.hue = h
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _lightness: Float100
+        _chroma: FloatOklch
+        _hue: Float360
+
+    _convert = staticmethod(oklch_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(oklch_to_srgb(SCALAR, self._lightness, self._chroma, self._hue))
 
 
 @channel_getter_setter("X", validate_Xd65)
@@ -234,8 +378,15 @@ class XYZd65(ColorSpace):
         self.Z = Z
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _x: Xd65
+        _y: Float100
+        _z: Zd65
+
+    _convert = staticmethod(xyz_d65_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(xyz_d65_to_srgb(SCALAR, self._x, self._y, self._z))
 
 
 @channel_getter_setter("X", validate_Xd50)
@@ -249,8 +400,15 @@ class XYZd50(ColorSpace):
         self.Z = Z
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _x: Xd50
+        _y: Float100
+        _z: Zd50
+
+    _convert = staticmethod(xyz_d50_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(xyz_d50_to_srgb(SCALAR, self._x, self._y, self._z))
 
 
 @channel_getter_setter("red", validate_float01)
@@ -264,8 +422,15 @@ class sRGBLinear(ColorSpace):
         self.blue = b
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _red: Float01
+        _green: Float01
+        _blue: Float01
+
+    _convert = staticmethod(linear_srgb_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(linear_srgb_to_srgb(SCALAR, self._red, self._green, self._blue))
 
 
 @channel_getter_setter("cyan", validate_float01)
@@ -283,5 +448,15 @@ class CMYK(ColorSpace):
         self.black = k
         self.alpha = a
 
+    if TYPE_CHECKING:
+        _cyan: Float01
+        _magenta: Float01
+        _yellow: Float01
+        _k: Float01
+
+    _convert = staticmethod(cmyk_to_srgb)
+
     def to_rgb(self) -> Tuple[Uint8, Uint8, Uint8]:
-        raise NotImplementedError
+        return to_uint8(
+            cmyk_to_srgb(SCALAR, self._cyan, self._magenta, self._yellow, self._k)
+        )
@@ -0,0 +1,256 @@
+import math
+from typing import Any, Sequence
+
+Matrix = tuple[tuple[float, float, float], ...]
+
+
+class SCALAR:
+    """
+    The subset of the NumPy namespace used by the conversions, for floats.
+
+    Each ``*_to_srgb`` function takes an array namespace ``xp`` followed by
+    the channels of its space and returns unclipped, gamma-encoded sRGB in
+    ``[0, 1]``. With ``SCALAR`` the channels are floats; with ``numpy`` they
+    are whole columns, so one call converts a batch.
+    """
+
+    cos = staticmethod(math.cos)
+    sin = staticmethod(math.sin)
+    radians = staticmethod(math.radians)
+    copysign = staticmethod(math.copysign)
+    minimum = staticmethod(min)
+    maximum = staticmethod(max)
+
+    @staticmethod
+    def where(condition: bool, left: float, right: float) -> float:
+        return left if condition else right
+
+
+def matmul(left: Matrix, right: Matrix) -> Matrix:
+    return tuple(
+        (
+            sum(row[k] * right[k][0] for k in range(3)),
+            sum(row[k] * right[k][1] for k in range(3)),
+            sum(row[k] * right[k][2] for k in range(3)),
+        )
+        for row in left
+    )
+
+
+def transform(matrix: Matrix, x: Any, y: Any, z: Any) -> tuple[Any, Any, Any]:
+    (a, b, c), (d, e, f), (g, h, i) = matrix
+    return (a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Matrices (CSS Color 4)
+# ─────────────────────────────────────────────────────────────────────────────
+XYZ_D65_TO_LINEAR_SRGB: Matrix = (
+    (3.2409699419045226, -1.537383177570094, -0.4986107602930034),
+    (-0.9692436362808796, 1.8759675015077202, 0.04155505740717559),
+    (0.05563007969699366, -0.20397695888897652, 1.0569715142428786),
+)
+D50_TO_D65: Matrix = (
+    (0.9554734527042182, -0.023098536874261423, 0.0632593086610217),
+    (-0.028369706963208136, 1.0099954580058226, 0.021041398966943008),
+    (0.012314001688319899, -0.020507696433477912, 1.3303659366080753),
+)
+LINEAR_P3_TO_XYZ_D65: Matrix = (
+    (0.4865709486482162, 0.26566769316909306, 0.1982172852343625),
+    (0.2289745640697488, 0.6917385218365064, 0.079286914093745),
+    (0.0, 0.04511338185890264, 1.043944368900976),
+)
+LINEAR_REC2020_TO_XYZ_D65: Matrix = (
+    (0.6369580483012914, 0.14461690358620832, 0.1688809751641721),
+    (0.2627002120112671, 0.6779980715188708, 0.05930171646986196),
+    (0.0, 0.028072693049087428, 1.060985057710791),
+)
+LINEAR_A98_TO_XYZ_D65: Matrix = (
+    (0.5766690429101305, 0.1855582379065463, 0.1882286462349947),
+    (0.29734497525053605, 0.6273635662554661, 0.07529145849399788),
+    (0.02703136138641234, 0.07068885253582723, 0.9913375368376388),
+)
+LINEAR_PROPHOTO_TO_XYZ_D50: Matrix = (
+    (0.7977604896723027, 0.13518583717574031, 0.0313493495815248),
+    (0.2880711282292934, 0.7118432178101014, 0.00008565396060525902),
+    (0.0, 0.0, 0.8251046025104601),
+)
+OKLAB_TO_LMS: Matrix = (
+    (1.0, 0.3963377773761749, 0.2158037573099136),
+    (1.0, -0.1055613458156586, -0.0638541728258133),
+    (1.0, -0.0894841775298119, -1.2914855480194092),
+)
+LMS_TO_LINEAR_SRGB: Matrix = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.707614701),
+)
+D50_WHITE = (0.3457 / 0.3585, 1.0, (1.0 - 0.3457 - 0.3585) / 0.3585)
+
+# Composed once at import: device spaces go through linear light and CIE
+# spaces through XYZ, each with one matrix straight into linear sRGB.
+XYZ_D50_TO_LINEAR_SRGB = matmul(XYZ_D65_TO_LINEAR_SRGB, D50_TO_D65)
+LINEAR_P3_TO_LINEAR_SRGB = matmul(XYZ_D65_TO_LINEAR_SRGB, LINEAR_P3_TO_XYZ_D65)
+LINEAR_REC2020_TO_LINEAR_SRGB = matmul(
+    XYZ_D65_TO_LINEAR_SRGB, LINEAR_REC2020_TO_XYZ_D65
+)
+LINEAR_A98_TO_LINEAR_SRGB = matmul(XYZ_D65_TO_LINEAR_SRGB, LINEAR_A98_TO_XYZ_D65)
+LINEAR_PROPHOTO_TO_LINEAR_SRGB = matmul(
+    XYZ_D50_TO_LINEAR_SRGB, LINEAR_PROPHOTO_TO_XYZ_D50
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Transfer functions (sign-preserving, so out-of-gamut values stay real)
+# ─────────────────────────────────────────────────────────────────────────────
+def srgb_decode(xp: Any, c: Any) -> Any:
+    a = abs(c)
+    return xp.where(
+        a <= 0.04045, c / 12.92, xp.copysign(((a + 0.055) / 1.055) ** 2.4, c)
+    )
+
+
+def srgb_encode(xp: Any, c: Any) -> Any:
+    a = abs(c)
+    return xp.where(
+        a <= 0.0031308, c * 12.92, xp.copysign(1.055 * a ** (1 / 2.4) - 0.055, c)
+    )
+
+
+REC2020_ALPHA = 1.09929682680944
+REC2020_BETA = 0.018053968510807
+
+
+def rec2020_decode(xp: Any, c: Any) -> Any:
+    a = abs(c)
+    return xp.where(
+        a < REC2020_BETA * 4.5,
+        c / 4.5,
+        xp.copysign(((a + REC2020_ALPHA - 1) / REC2020_ALPHA) ** (1 / 0.45), c),
+    )
+
+
+def a98_decode(xp: Any, c: Any) -> Any:
+    return xp.copysign(abs(c) ** (563 / 256), c)
+
+
+def prophoto_decode(xp: Any, c: Any) -> Any:
+    a = abs(c)
+    return xp.where(a <= 16 / 512, c / 16, xp.copysign(a**1.8, c))
+
+
+def _encode(xp: Any, rgb: tuple[Any, Any, Any]) -> tuple[Any, Any, Any]:
+    return (srgb_encode(xp, rgb[0]), srgb_encode(xp, rgb[1]), srgb_encode(xp, rgb[2]))
+
+
+def _device(xp: Any, decode: Any, matrix: Matrix, r: Any, g: Any, b: Any) -> Any:
+    linear = (decode(xp, r / 255), decode(xp, g / 255), decode(xp, b / 255))
+    return _encode(xp, transform(matrix, *linear))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Color spaces
+# ─────────────────────────────────────────────────────────────────────────────
+def srgb_to_srgb(xp: Any, r: Any, g: Any, b: Any) -> tuple[Any, Any, Any]:
+    return (r / 255, g / 255, b / 255)
+
+
+def hsv_to_srgb(xp: Any, h: Any, s: Any, v: Any) -> tuple[Any, Any, Any]:
+    def channel(n: int) -> Any:
+        k = (n + h / 60) % 6
+        return v - v * s * xp.maximum(0, xp.minimum(xp.minimum(k, 4 - k), 1))
+
+    return (channel(5), channel(3), channel(1))
+
+
+def hsl_to_srgb(xp: Any, h: Any, s: Any, lightness: Any) -> tuple[Any, Any, Any]:
+    a = s * xp.minimum(lightness, 1 - lightness)
+
+    def channel(n: int) -> Any:
+        k = (n + h / 30) % 12
+        return lightness - a * xp.maximum(-1, xp.minimum(xp.minimum(k - 3, 9 - k), 1))
+
+    return (channel(0), channel(8), channel(4))
+
+
+def hwb_to_srgb(xp: Any, h: Any, w: Any, black: Any) -> tuple[Any, Any, Any]:
+    # Whiteness and blackness adding up to 1 or more give a gray.
+    achromatic = w + black >= 1
+    gray = w / xp.maximum(w + black, 1)
+    scale = 1 - w - black
+    r, g, b = hsl_to_srgb(xp, h, 1, 0.5)
+    return (
+        xp.where(achromatic, gray, r * scale + w),
+        xp.where(achromatic, gray, g * scale + w),
+        xp.where(achromatic, gray, b * scale + w),
+    )
+
+
+def display_p3_to_srgb(xp: Any, r: Any, g: Any, b: Any) -> tuple[Any, Any, Any]:
+    return _device(xp, srgb_decode, LINEAR_P3_TO_LINEAR_SRGB, r, g, b)
+
+
+def rec2020_to_srgb(xp: Any, r: Any, g: Any, b: Any) -> tuple[Any, Any, Any]:
+    return _device(xp, rec2020_decode, LINEAR_REC2020_TO_LINEAR_SRGB, r, g, b)
+
+
+def a98_rgb_to_srgb(xp: Any, r: Any, g: Any, b: Any) -> tuple[Any, Any, Any]:
+    return _device(xp, a98_decode, LINEAR_A98_TO_LINEAR_SRGB, r, g, b)
+
+
+def prophoto_rgb_to_srgb(xp: Any, r: Any, g: Any, b: Any) -> tuple[Any, Any, Any]:
+    return _device(xp, prophoto_decode, LINEAR_PROPHOTO_TO_LINEAR_SRGB, r, g, b)
+
+
+LAB_KAPPA = 24389 / 27
+LAB_EPSILON = 216 / 24389
+
+
+def cielab_to_srgb(xp: Any, L: Any, a: Any, b: Any) -> tuple[Any, Any, Any]:
+    fy = (L + 16) / 116
+    fx = a / 500 + fy
+    fz = fy - b / 200
+    x = xp.where(fx**3 > LAB_EPSILON, fx**3, (116 * fx - 16) / LAB_KAPPA)
+    y = xp.where(L > LAB_KAPPA * LAB_EPSILON, fy**3, L / LAB_KAPPA)
+    z = xp.where(fz**3 > LAB_EPSILON, fz**3, (116 * fz - 16) / LAB_KAPPA)
+    xyz = (x * D50_WHITE[0], y * D50_WHITE[1], z * D50_WHITE[2])
+    return _encode(xp, transform(XYZ_D50_TO_LINEAR_SRGB, *xyz))
+
+
+def lch_to_srgb(xp: Any, L: Any, c: Any, h: Any) -> tuple[Any, Any, Any]:
+    hue = xp.radians(h)
+    return cielab_to_srgb(xp, L, c * xp.cos(hue), c * xp.sin(hue))
+
+
+def oklab_to_srgb(xp: Any, L: Any, a: Any, b: Any) -> tuple[Any, Any, Any]:
+    # Lightness is stored as a percentage.
+    lms = transform(OKLAB_TO_LMS, L / 100, a, b)
+    cubed = (lms[0] ** 3, lms[1] ** 3, lms[2] ** 3)
+    return _encode(xp, transform(LMS_TO_LINEAR_SRGB, *cubed))
+
+
+def oklch_to_srgb(xp: Any, L: Any, c: Any, h: Any) -> tuple[Any, Any, Any]:
+    hue = xp.radians(h)
+    return oklab_to_srgb(xp, L, c * xp.cos(hue), c * xp.sin(hue))
+
+
+def xyz_d65_to_srgb(xp: Any, X: Any, Y: Any, Z: Any) -> tuple[Any, Any, Any]:
+    return _encode(xp, transform(XYZ_D65_TO_LINEAR_SRGB, X / 100, Y / 100, Z / 100))
+
+
+def xyz_d50_to_srgb(xp: Any, X: Any, Y: Any, Z: Any) -> tuple[Any, Any, Any]:
+    return _encode(xp, transform(XYZ_D50_TO_LINEAR_SRGB, X / 100, Y / 100, Z / 100))
+
+
+def linear_srgb_to_srgb(xp: Any, r: Any, g: Any, b: Any) -> tuple[Any, Any, Any]:
+    return _encode(xp, (r, g, b))
+
+
+def cmyk_to_srgb(xp: Any, c: Any, m: Any, y: Any, k: Any) -> tuple[Any, Any, Any]:
+    return ((1 - c) * (1 - k), (1 - m) * (1 - k), (1 - y) * (1 - k))
+
+
+def to_uint8(rgb: Sequence[float]) -> tuple[int, int, int]:
+    """Clip encoded sRGB to the gamut and round it to bytes."""
+    r, g, b = (round(min(max(c, 0.0), 1.0) * 255) for c in rgb)
+    return (r, g, b)
@@ -1,3 +1,5 @@
+from typing import Any, Callable
+
 from .exceptions import DefaultChannelOutOfBounds
 from .numeric import (
     Float01,
@@ -13,57 +15,100 @@ from .numeric import (
     Zd65,
 )
 
+Bounds = tuple[int | float, int | float]
+
+# Inclusive channel ranges, shared by the validators and VALIDATOR_BOUNDS.
+UINT8_BOUNDS: Bounds = (0, 255)
+FLOAT01_BOUNDS: Bounds = (0.0, 1.0)
+FLOAT360_BOUNDS: Bounds = (0.0, 360.0)
+FLOAT100_BOUNDS: Bounds = (0.0, 100.0)
+FLOAT8_BOUNDS: Bounds = (-128.0, 127.0)
+FLOAT_OKLAB_BOUNDS: Bounds = (-0.4, 0.4)
+FLOAT_OKLCH_BOUNDS: Bounds = (-0.4, 0.4)
+XD65_BOUNDS: Bounds = (0.0, 95.047)
+ZD65_BOUNDS: Bounds = (0.0, 108.883)
+XD50_BOUNDS: Bounds = (0.0, 96.6797)
+ZD50_BOUNDS: Bounds = (0.0, 82.5188)
+
 
 def validate_uint8(name: str, value: Uint8) -> None:
-    if not (0 <= value <= 255):
-        raise DefaultChannelOutOfBounds(name, value, (0, 255))
+    low, high = UINT8_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, UINT8_BOUNDS)
 
 
 def validate_float01(name: str, value: Float01) -> None:
-    if not (0.0 <= value <= 1.0):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 1.0))
+    low, high = FLOAT01_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, FLOAT01_BOUNDS)
 
 
 def validate_float360(name: str, value: Float360) -> None:
-    if not (0.0 <= value <= 360.0):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 360.0))
+    low, high = FLOAT360_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, FLOAT360_BOUNDS)
 
 
 def validate_float100(name: str, value: Float100) -> None:
-    if not (0.0 <= value <= 100.0):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 100.0))
+    low, high = FLOAT100_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, FLOAT100_BOUNDS)
 
 
 def validate_float8(name: str, value: Float8) -> None:
-    if not (-128.0 <= value <= 127.0):
-        raise DefaultChannelOutOfBounds(name, value, (-128.0, 127.0))
+    low, high = FLOAT8_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, FLOAT8_BOUNDS)
 
 
 def validate_float_oklab(name: str, value: FloatOklab) -> None:
-    if not (-0.4 <= value <= 0.4):
-        raise DefaultChannelOutOfBounds(name, value, (-0.4, 0.4))
+    low, high = FLOAT_OKLAB_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, FLOAT_OKLAB_BOUNDS)
 
 
 def validate_float_oklch(name: str, value: FloatOklch) -> None:
-    if not (-0.4 <= value <= 0.4):
-        raise DefaultChannelOutOfBounds(name, value, (-0.4, 0.4))
+    low, high = FLOAT_OKLCH_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, FLOAT_OKLCH_BOUNDS)
 
 
 def validate_Xd65(name: str, value: Xd65) -> None:
-    if not (0.0 <= value <= 95.047):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 95.047))
+    low, high = XD65_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, XD65_BOUNDS)
 
 
 def validate_Zd65(name: str, value: Zd65) -> None:
-    if not (0.0 <= value <= 108.883):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 108.883))
+    low, high = ZD65_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, ZD65_BOUNDS)
 
 
 def validate_Xd50(name: str, value: Xd50) -> None:
-    if not (0.0 <= value <= 96.6797):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 96.6797))
+    low, high = XD50_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, XD50_BOUNDS)
 
 
 def validate_Zd50(name: str, value: Zd50) -> None:
-    if not (0.0 <= value <= 82.5188):
-        raise DefaultChannelOutOfBounds(name, value, (0.0, 82.5188))
+    low, high = ZD50_BOUNDS
+    if not (low <= value <= high):
+        raise DefaultChannelOutOfBounds(name, value, ZD50_BOUNDS)
+
+
+# Bounds of every validator above, so channel accessors can inline the range
+# check instead of calling the validator on each write.
+VALIDATOR_BOUNDS: dict[Callable[[str, Any], None], Bounds] = {
+    validate_uint8: UINT8_BOUNDS,
+    validate_float01: FLOAT01_BOUNDS,
+    validate_float360: FLOAT360_BOUNDS,
+    validate_float100: FLOAT100_BOUNDS,
+    validate_float8: FLOAT8_BOUNDS,
+    validate_float_oklab: FLOAT_OKLAB_BOUNDS,
+    validate_float_oklch: FLOAT_OKLCH_BOUNDS,
+    validate_Xd65: XD65_BOUNDS,
+    validate_Zd65: ZD65_BOUNDS,
+    validate_Xd50: XD50_BOUNDS,
+    validate_Zd50: ZD50_BOUNDS,
+}
@@ -1,5 +1,130 @@
+import linecache
+from functools import cache
+from itertools import count
+from types import CodeType
 from typing import Any, Callable
 
+from src.colors.types.exceptions import DefaultChannelOutOfBounds
+from src.colors.types.validators import VALIDATOR_BOUNDS
+
+
+def _check_source(
+    channel_name: str,
+    value: str,
+    validate_method: Callable[[str, Any], Any],
+    namespace: dict[str, Any],
+) -> str:
+    """
+    Source for validating ``value``: an inlined range check when the bounds
+    of ``validate_method`` are known, a call to it otherwise.
+    """
+    bounds = VALIDATOR_BOUNDS.get(validate_method)
+    if bounds is None:
+        namespace[f"_validate_{channel_name}"] = validate_method
+        return f"    _validate_{channel_name}({channel_name!r}, {value})\n"
+    low, high = bounds
+    return (
+        f"    if not ({low!r} <= {value} <= {high!r}):\n"
+        f"        raise DefaultChannelOutOfBounds("
+        f"{channel_name!r}, {value}, {bounds!r})\n"
+    )
+
+
+# Same flags as ``inspect.CO_VARARGS`` and ``inspect.CO_VARKEYWORDS``;
+# ``inspect`` itself is too slow to import for this.
+CO_VARARGS = 0x04
+CO_VARKEYWORDS = 0x08
+
+
+_sources = count(1)
+
+
+@cache
+def _code(source: str, name: str) -> CodeType:
+    # Color spaces share channel names, so most accessors compile only once.
+    # The source is kept in linecache so tracebacks show the failing check.
+    filename = f"<generated {name} #{next(_sources)}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return compile(source, filename, "exec")
+
+
+def _compile(source: str, name: str, namespace: dict[str, Any]) -> Any:
+    namespace["DefaultChannelOutOfBounds"] = DefaultChannelOutOfBounds
+    exec(_code(source, name), namespace)
+    return namespace[name]
+
+
+def _parameters(function: Callable) -> list[str] | None:
+    """Names after ``self``, or ``None`` unless all are plain positional."""
+    code = function.__code__
+    if (
+        code.co_posonlyargcount
+        or code.co_kwonlyargcount
+        or code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+    ):
+        return None
+    return list(code.co_varnames[1 : code.co_argcount])
+
+
+def _clear_caches(cls: Any) -> str:
+    """Source resetting every slot named in ``cls._caches`` to ``None``."""
+    return "".join(f"    self.{name} = None\n" for name in getattr(cls, "_caches", ()))
+
+
+def _init_parameters(cls: Any) -> list[str] | None:
+    init = cls.__dict__.get("__init__")
+    return None if init is None else _parameters(init)
+
+
+def _fuse_init(
+    cls: Any, names: list[str], channels: list[tuple[str, str, Callable]]
+) -> None:
+    """
+    Replace ``cls.__init__`` with one function that checks and stores every
+    channel, and add a ``_unchecked`` constructor that skips the checks.
+
+    Channels are declared in the same order as the ``__init__`` parameters,
+    which is how every color space in this package is written.
+    """
+    init = cls.__dict__["__init__"]
+    namespace: dict[str, Any] = {}
+    clear = _clear_caches(cls)
+    checked = "".join(
+        _check_source(channel, name, validate, namespace)
+        + f"    self.{private_attr} = {name}\n"
+        for name, (channel, private_attr, validate) in zip(names, channels, strict=True)
+    )
+    stores = "".join(
+        f"    self.{private_attr} = {name}\n"
+        for name, (_, private_attr, _) in zip(names, channels, strict=True)
+    )
+    arguments = ", ".join(names)
+
+    fused = _compile(
+        f"def __init__(self, {arguments}) -> None:\n{checked}{clear}",
+        "__init__",
+        namespace,
+    )
+    fused.__defaults__ = init.__defaults__
+    fused.__annotations__ = dict(init.__annotations__)
+    fused.__doc__ = init.__doc__
+    fused.__qualname__ = f"{cls.__qualname__}.__init__"
+    fused.__module__ = cls.__module__
+
+    unchecked = _compile(
+        f"def _unchecked(cls, {arguments}):\n"
+        f"    self = cls.__new__(cls)\n{stores}{clear}"
+        f"    return self\n",
+        "_unchecked",
+        {},
+    )
+    unchecked.__defaults__ = init.__defaults__
+    unchecked.__doc__ = "Build from channels already known to be in range."
+    unchecked.__qualname__ = f"{cls.__qualname__}._unchecked"
+
+    cls.__init__ = fused
+    cls._unchecked = classmethod(unchecked)
+
 
 def channel_getter_setter(
     channel_name: str,
@@ -12,6 +137,15 @@ def channel_getter_setter(
     The setter uses the specified validation method to ensure the value is
     within the allowed range.
 
+    The accessors are generated as plain functions reading and writing the
+    private attribute directly, with the range check of ``validate_method``
+    inlined when its bounds are registered in ``VALIDATOR_BOUNDS``. Once the
+    last channel of a class is registered, its ``__init__`` is fused the
+    same way and a trusted ``_unchecked`` constructor is added.
+
+    Slots listed in the class attribute ``_caches`` hold values derived
+    from the channels; the setters and constructors reset them to ``None``.
+
     Parameters
     ----------
     channel_name : str
@@ -29,14 +163,31 @@ def channel_getter_setter(
         else:
             private_attr: str = f"_{alias.lower()}"
 
-        def getter(self) -> type_:
-            return getattr(self, private_attr)
-
-        def setter(self, value: type_) -> None:
-            validate_method(channel_name, value)
-            setattr(self, private_attr, value)
+        namespace: dict[str, Any] = {}
+        getter = _compile(
+            f"def getter(self):\n    return self.{private_attr}\n", "getter", namespace
+        )
+        getter.__annotations__ = {"return": type_}
+        setter = _compile(
+            "def setter(self, value) -> None:\n"
+            + _check_source(channel_name, "value", validate_method, namespace)
+            + f"    self.{private_attr} = value\n"
+            + _clear_caches(cls),
+            "setter",
+            namespace,
+        )
+        setter.__annotations__ = {"value": type_, "return": None}
 
         setattr(cls, channel_name, property(getter, setter))
+
+        # Decorators apply bottom-up, so prepending keeps declaration order.
+        channels = [(channel_name, private_attr, validate_method)]
+        channels += cls.__dict__.get("_channels", [])
+        cls._channels = channels
+        names = _init_parameters(cls)
+        if names is not None and len(names) == len(channels):
+            # The topmost decorator registers the last channel.
+            _fuse_init(cls, names, channels)
         return cls
 
     return decorator
@@ -0,0 +1,90 @@
+import inspect
+from typing import Any, Callable
+
+import pytest
+
+from src.colors.types import color_spaces
+from src.colors.types.color_space import ColorSpace
+from src.colors.types.color_spaces import CMYK, HSV, sRGB
+from src.colors.types.exceptions import DefaultChannelOutOfBounds
+from src.colors.types.validators import VALIDATOR_BOUNDS
+
+SPACES = [
+    cls
+    for cls in vars(color_spaces).values()
+    if isinstance(cls, type) and issubclass(cls, ColorSpace) and cls is not ColorSpace
+]
+Validator = Callable[[str, Any], None]
+
+
+def channels(cls: type[ColorSpace]) -> list[tuple[str, str, Validator]]:
+    # Registered by channel_getter_setter, in declaration order.
+    return cls.__dict__["_channels"]
+
+
+CHANNELS = [
+    (cls, name, validate) for cls in SPACES for name, _, validate in channels(cls)
+]
+
+
+def message(function: Callable[..., Any], *args: Any) -> str:
+    with pytest.raises(DefaultChannelOutOfBounds) as info:
+        function(*args)
+    return str(info.value)
+
+
+def valid_instance(cls: type[ColorSpace]) -> Any:
+    return cls(*(VALIDATOR_BOUNDS[v][0] for _, _, v in channels(cls)))
+
+
+@pytest.mark.parametrize(("cls", "name", "validate"), CHANNELS)
+def test_setter_matches_validator(
+    cls: type[ColorSpace], name: str, validate: Validator
+) -> None:
+    low, high = VALIDATOR_BOUNDS[validate]
+    instance = valid_instance(cls)
+    for value in (low, high):
+        setattr(instance, name, value)
+        assert getattr(instance, name) == value
+    for value in (low - 1, high + 1):
+        expected = message(validate, name, value)
+        assert message(setattr, instance, name, value) == expected
+
+
+@pytest.mark.parametrize("cls", SPACES)
+def test_constructor_matches_validator(cls: type[ColorSpace]) -> None:
+    registered = channels(cls)
+    for index, (name, _, validate) in enumerate(registered):
+        args = [VALIDATOR_BOUNDS[v][0] for _, _, v in registered]
+        args[index] = VALIDATOR_BOUNDS[validate][1] + 1
+        expected = message(validate, name, args[index])
+        assert message(cls, *args) == expected
+
+
+def test_messages_unchanged() -> None:
+    assert message(sRGB, 256, 0, 0) == (
+        "256 is out of bounds for the red channel.\nExpected range: [0, 255]"
+    )
+    assert message(HSV, 400, 0, 0) == (
+        "400 is out of bounds for the hue channel.\nExpected range: [0.0, 360.0]"
+    )
+    # The aliased channel reports its public name.
+    assert message(CMYK, 0, 0, 0, 2) == (
+        "2 is out of bounds for the black channel.\nExpected range: [0.0, 1.0]"
+    )
+
+
+def test_signatures_and_source_survive_codegen() -> None:
+    assert list(inspect.signature(sRGB.__init__).parameters) == [
+        "self",
+        "r",
+        "g",
+        "b",
+        "a",
+    ]
+    assert sRGB(1, 2, 3).alpha == 1.0
+    assert "raise DefaultChannelOutOfBounds('red'" in inspect.getsource(sRGB.__init__)
+
+
+def test_unchecked_skips_validation() -> None:
+    assert sRGB._unchecked(300, 0, 0).red == 300
@@ -0,0 +1,68 @@
+import pytest
+
+from src.colors.types import color
+from src.colors.types.color_spaces import HSV, sRGB
+from src.colors.types.exceptions import DefaultChannelOutOfBounds
+
+
+def lerp(left: int, right: int, ratio: float) -> int:
+    # The byte lerp Color.interpolate has always used.
+    return int(left * (1 - ratio) + right * ratio)
+
+
+def test_srgb_value_semantics() -> None:
+    assert sRGB(1, 2, 3) == sRGB(1, 2, 3)
+    assert sRGB(1, 2, 3) != sRGB(1, 2, 3, 0.5)
+    assert len({sRGB(1, 2, 3), sRGB(1, 2, 3), sRGB(3, 2, 1)}) == 2
+    assert sRGB(0, 0, 0) != HSV(0, 0, 0)
+
+
+def test_srgb_setter_resets_cached_sgr() -> None:
+    channel = sRGB(1, 2, 3)
+    assert str(channel) == "2;1;2;3"
+    channel.green = 200
+    assert str(channel) == "2;1;200;3"
+    with pytest.raises(DefaultChannelOutOfBounds):
+        channel.blue = 256
+
+
+def test_unchecked_matches_validated_constructor() -> None:
+    assert sRGB._unchecked(10, 20, 30) == sRGB(10, 20, 30)
+    assert str(sRGB._unchecked(10, 20, 30)) == "2;10;20;30"
+
+
+def test_color_copies_and_compares_by_value() -> None:
+    source = sRGB(10, 20, 30)
+    fg = color(source)
+    source.red = 99
+    assert fg.foreground == sRGB(10, 20, 30)
+    assert fg == color(sRGB(10, 20, 30))
+    assert fg != color(sRGB(10, 20, 30), sRGB(0, 0, 0))
+    assert hash(fg) == hash(color(sRGB(10, 20, 30)))
+
+
+def test_str_and_bytes_follow_mutation() -> None:
+    fg_bg = color(sRGB(1, 2, 3), sRGB(4, 5, 6))
+    assert str(fg_bg) == "38;2;1;2;3;48;2;4;5;6"
+    assert bytes(fg_bg) == b"38;2;1;2;3;48;2;4;5;6"
+    fg_bg.background.red = 7
+    assert str(fg_bg) == "38;2;1;2;3;48;2;7;5;6"
+    assert bytes(fg_bg) == b"38;2;1;2;3;48;2;7;5;6"
+
+
+@pytest.mark.parametrize("ratio", [0.0, 0.1, 1 / 3, 0.5, 0.9, 1.0])
+def test_interpolate_matches_byte_lerp(ratio: float) -> None:
+    left = color(sRGB(255, 0, 17), sRGB(0, 0, 0))
+    right = color(sRGB(0, 255, 200), sRGB(255, 128, 1))
+    mixed = left.interpolate(right, ratio)
+    assert mixed.foreground.to_rgb() == tuple(
+        lerp(a, b, ratio) for a, b in zip((255, 0, 17), (0, 255, 200), strict=True)
+    )
+    assert mixed.background.to_rgb() == tuple(
+        lerp(a, b, ratio) for a, b in zip((0, 0, 0), (255, 128, 1), strict=True)
+    )
+
+
+def test_extrapolation_is_validated() -> None:
+    with pytest.raises(DefaultChannelOutOfBounds):
+        color(sRGB(0, 0, 0)).interpolate(color(sRGB(255, 255, 255)), 1.5)
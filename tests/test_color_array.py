@@ -0,0 +1,72 @@
+import random
+from typing import Any, Optional, Sequence
+
+import pytest
+
+from src.colors import color_array
+from src.colors.color_depth import ColorDepth, sgr
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.pallete import Pallete, PalleteGenerator
+from src.colors.static_color import StaticColorGenerator
+from src.colors.types import ColorGenerator, color
+from src.colors.types.color_spaces import sRGB
+
+DEPTHS: list[ColorDepth] = ["truecolor", "256", "16", "none"]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def batch(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(color_array, "NUMPY_MIN_ROWS", 0)
+    else:
+        monkeypatch.setattr(color_array, "_numpy", lambda: None)
+    return request.param
+
+
+def generators(seed: int) -> Sequence[ColorGenerator[Any]]:
+    rng = random.Random(seed)
+
+    def rgb() -> sRGB:
+        return sRGB(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+
+    background = seed % 2 == 0
+    # Either every stop has a background or none has.
+    stops: list[Any] = [
+        color(rgb(), rgb()) if background else color(rgb())
+        for _ in range(rng.randint(2, 4))
+    ]
+    positions: Optional[list[float]] = None
+    if seed % 3 == 0:
+        positions = sorted(rng.choice([0.0, 0.5, rng.random(), 1.0]) for _ in stops)
+    width = rng.randint(1, 90)
+    return [
+        GradientGenerator(width, Gradient(*stops, positions=positions)),
+        PalleteGenerator(width, Pallete(*stops, positions=positions), seed % 5 == 0),
+        StaticColorGenerator(width, stops[0]),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_matches_scalar_path(batch: str, seed: int) -> None:
+    for generator in generators(seed):
+        for variant in (generator, generator.no_background()):
+            colors = list(variant)
+            array = variant.to_array()
+            assert len(array) == len(colors)
+            assert [str(c) for c in array] == [str(c) for c in colors]
+            for depth in DEPTHS:
+                assert array.sgr(depth) == [sgr(c, depth) for c in colors]
+
+
+def test_repeat_and_rows(batch: str) -> None:
+    stops = [
+        color(sRGB(255, 0, 0), sRGB(0, 0, 0)),
+        color(sRGB(0, 0, 255), sRGB(9, 9, 9)),
+    ]
+    array = GradientGenerator(5, Gradient(*stops)).to_array()
+    repeated = array.repeat(3)
+    assert repeated.rows() == array.rows() * 3
+    assert repeated.rows(True) == array.rows(True) * 3
+    with pytest.raises(ValueError):
+        array.no_background().rows(True)
@@ -0,0 +1,121 @@
+import colorsys
+import math
+import random
+from typing import Callable
+
+import pytest
+
+from src.colors.color_array import ColorArray
+from src.colors.interpolation import to_working
+from src.colors.types import color_spaces as cs
+from src.colors.types.color_space import ColorSpace
+from src.colors.types.validators import VALIDATOR_BOUNDS
+
+RGB = tuple[int, int, int]
+
+rng = random.Random(7)
+SAMPLES: list[RGB] = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (12, 200, 99)] + [
+    (rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(60)
+]
+
+
+def hsv(rgb: RGB) -> ColorSpace:
+    h, s, v = colorsys.rgb_to_hsv(*(c / 255 for c in rgb))
+    return cs.HSV(h * 360, s, v)
+
+
+def hsl(rgb: RGB) -> ColorSpace:
+    h, lightness, s = colorsys.rgb_to_hls(*(c / 255 for c in rgb))
+    return cs.HSL(h * 360, s, lightness)
+
+
+def hwb(rgb: RGB) -> ColorSpace:
+    h, s, v = colorsys.rgb_to_hsv(*(c / 255 for c in rgb))
+    return cs.HWB(h * 360, (1 - s) * v, 1 - v)
+
+
+def cmyk(rgb: RGB) -> ColorSpace:
+    k = 1 - max(rgb) / 255
+    if k == 1:
+        return cs.CMYK(0, 0, 0, 1)
+    c, m, y = ((1 - channel / 255 - k) / (1 - k) for channel in rgb)
+    return cs.CMYK(c, m, y, k)
+
+
+def linear(rgb: RGB) -> ColorSpace:
+    return cs.sRGBLinear(*to_working("linear", rgb))
+
+
+def oklab(rgb: RGB) -> ColorSpace:
+    L, a, b = to_working("oklab", rgb)
+    return cs.Oklab(L * 100, a, b)
+
+
+def oklch(rgb: RGB) -> ColorSpace:
+    L, c, h = to_working("oklch", rgb)
+    return cs.Oklch(L * 100, c, math.degrees(h) % 360)
+
+
+@pytest.mark.parametrize("forward", [hsv, hsl, hwb, cmyk, linear, oklab, oklch])
+def test_round_trip(forward: Callable[[RGB], ColorSpace]) -> None:
+    for rgb in SAMPLES:
+        assert forward(rgb).to_rgb() == rgb
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        cs.DisplayP3(234, 51, 35),
+        cs.CIELAB(54.29, 80.80, 69.89),
+        cs.Oklab(62.796, 0.22486, 0.12585),
+        cs.Oklch(62.796, 0.25768, 29.234),
+        cs.XYZd65(41.24, 21.26, 1.93),
+        cs.XYZd50(43.61, 22.25, 1.39),
+    ],
+    ids=lambda space: type(space).__name__,
+)
+def test_srgb_red_references(space: ColorSpace) -> None:
+    assert space.to_rgb() == (255, 0, 0)
+
+
+def test_lch_is_polar_cielab() -> None:
+    for L, c, h in [(50, 40, 0), (75, 20.5, 123.4), (30, 60, 300)]:
+        hue = math.radians(h)
+        lab = cs.CIELAB(L, c * math.cos(hue), c * math.sin(hue))
+        assert cs.LCH(L, c, h).to_rgb() == lab.to_rgb()
+
+
+@pytest.mark.parametrize(
+    "white",
+    [
+        cs.CIELAB(100, 0, 0),
+        cs.Oklch(100, 0, 0),
+        cs.XYZd65(95.047, 100, 108.883),
+        cs.XYZd50(96.4212, 100, 82.5188),
+        cs.Rec2020(255, 255, 255),
+        cs.A98RGB(255, 255, 255),
+        cs.ProPhotoRGB(255, 255, 255),
+    ],
+    ids=lambda space: type(space).__name__,
+)
+def test_white_points(white: ColorSpace) -> None:
+    assert white.to_rgb() == (255, 255, 255)
+
+
+def sample(low: float, high: float) -> float:
+    if isinstance(low, int) and isinstance(high, int):
+        return rng.randint(low, high)
+    return rng.uniform(low, high)
+
+
+@pytest.mark.parametrize("cls", [cs.HSL, cs.LCH, cs.Oklab, cs.Rec2020, cs.CMYK])
+def test_batch_matches_scalar(cls: type[ColorSpace]) -> None:
+    bounds = [
+        VALIDATOR_BOUNDS[validate]
+        for name, _, validate in cls.__dict__["_channels"]
+        if name != "alpha"
+    ]
+    rows = [tuple(sample(*b) for b in bounds) for _ in range(200)]
+    assert ColorArray.from_space(cls, rows).rows() == [
+        cls(*row).to_rgb() for row in rows
+    ]
@@ -0,0 +1,76 @@
+import re
+from io import StringIO
+
+import pytest
+
+from src.bars.backend.bar import BarBackend
+from src.bars.delta_renderer import DeltaRenderer
+from src.colors.gradient import Gradient
+from src.colors.types import color
+from src.colors.types.color_spaces import sRGB
+
+TOKEN = re.compile(r"\033\[([0-9;]*)([A-Za-z])|.", re.S)
+
+
+def screen(*frames: str) -> dict[int, tuple[str, str]]:
+    """Replay frames on one line; map each column to its (glyph, SGR)."""
+    cells: dict[int, tuple[str, str]] = {}
+    column, sgr = 1, ""
+    for frame in frames:
+        for match in TOKEN.finditer(frame):
+            params, command = match.groups()
+            if command == "G":
+                column = int(params or 1)
+            elif command == "K":
+                cells = {k: v for k, v in cells.items() if k < column}
+            elif command == "m":
+                sgr = "" if params in ("", "0") else params
+            elif command is not None:
+                raise ValueError(match.group(0))
+            else:
+                cells[column] = (match.group(0), sgr)
+                column += 1
+    return cells
+
+
+@pytest.fixture
+def backend() -> BarBackend:
+    red = color(sRGB(255, 0, 0))
+    green = color(sRGB(0, 255, 0))
+    return BarBackend(Gradient(red, green), 10)
+
+
+@pytest.mark.parametrize("column", [1, 5])
+def test_deltas_match_full_redraw(backend: BarBackend, column: int) -> None:
+    renderer = DeltaRenderer(backend, column)
+    frames = []
+    for step in [0, 3, 7, 40, 41, 39, 80, 12, 80]:
+        counter = f" {step}/80"
+        stats = "fast" if step % 2 else ""
+        frames.append(renderer(step / 80, counter, stats))
+        suffix = f"{counter} | {stats}" if stats else counter
+        full = f"\033[{column}G" + backend(step / 80) + suffix
+        assert screen(*frames) == screen(full)
+
+
+def test_unchanged_frame_is_empty(backend: BarBackend) -> None:
+    renderer = DeltaRenderer(backend)
+    renderer(0.5, " 5/10")
+    assert renderer(0.5, " 5/10") == ""
+
+
+def test_reset_redraws_everything(backend: BarBackend) -> None:
+    renderer = DeltaRenderer(backend, 3)
+    first = renderer(0.25, " x")
+    renderer(0.75, " y")
+    renderer.reset()
+    assert renderer(0.25, " x") == first
+
+
+def test_write_skips_empty_frames(backend: BarBackend) -> None:
+    renderer = DeltaRenderer(backend)
+    out = StringIO()
+    renderer.write(0.5, file=out)
+    written = out.getvalue()
+    renderer.write(0.5, file=out)
+    assert written and out.getvalue() == written
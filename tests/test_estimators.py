@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+from src.bars.estimators import EMAEstimator, WindowEstimator
+
+
+def test_ema_first_interval_is_raw_rate() -> None:
+    estimator = EMAEstimator(smoothing=0.5)
+    estimator.add(0.0, 0)
+    assert estimator.rate() == 0.0
+    estimator.add(2.0, 20)
+    assert estimator.rate() == 10.0
+
+
+def test_ema_smooths_later_intervals() -> None:
+    estimator = EMAEstimator(smoothing=0.25)
+    for timestamp, count in [(0.0, 0), (1.0, 10), (2.0, 30)]:
+        estimator.add(timestamp, count)
+    assert estimator.rate() == pytest.approx(10 + 0.25 * (20 - 10))
+
+
+def test_ema_ignores_non_increasing_time() -> None:
+    estimator = EMAEstimator()
+    estimator.add(1.0, 0)
+    estimator.add(2.0, 5)
+    estimator.add(2.0, 500)
+    assert estimator.rate() == 5.0
+
+
+def test_window_averages_last_samples() -> None:
+    estimator = WindowEstimator(size=3)
+    # Slow start, then steady 100/s: once the start leaves the ring only
+    # the recent rate is left.
+    for timestamp, count in [(0.0, 0), (10.0, 1), (11.0, 101), (12.0, 201)]:
+        estimator.add(timestamp, count)
+    assert estimator.rate() == 100.0
+
+
+def test_window_wraps_many_times() -> None:
+    estimator = WindowEstimator(size=4)
+    for step in range(1, 103):
+        estimator.add(float(step), 3 * step)
+    assert estimator.rate() == 3.0
+
+
+def test_reset_and_eta() -> None:
+    for estimator in (EMAEstimator(), WindowEstimator()):
+        estimator.add(0.0, 0)
+        estimator.add(1.0, 4)
+        assert estimator.eta(8) == 2.0
+        estimator.reset()
+        assert estimator.rate() == 0.0
+        assert math.isinf(estimator.eta(8))
+
+
+@pytest.mark.parametrize("smoothing", [0.0, 1.5])
+def test_invalid_smoothing(smoothing: float) -> None:
+    with pytest.raises(ValueError):
+        EMAEstimator(smoothing)
+
+
+def test_window_needs_two_slots() -> None:
+    with pytest.raises(ValueError):
+        WindowEstimator(1)
@@ -0,0 +1,87 @@
+from sys import getsizeof
+
+import pytest
+
+from src.bars.backend.bar import BarBackend
+from src.bars.backend.frame_cache import FrameCache
+from src.bars.backend.strategy import choose_frame_cache
+from src.colors.gradient import Gradient
+from src.colors.types import color
+from src.colors.types.color_spaces import sRGB
+
+
+class Builder:
+    def __init__(self) -> None:
+        self.built: list[int] = []
+
+    def __call__(self, filled: int) -> str:
+        self.built.append(filled)
+        return "#" * filled + "-" * (32 - filled)
+
+
+FRAME_BYTES = getsizeof("x" * 32)
+
+
+def test_frames_are_built_once_on_first_use() -> None:
+    build = Builder()
+    cache = FrameCache(build)
+    assert len(cache) == 0
+    assert cache[3] == cache[3] == build(3)
+    assert build.built == [3, 3]
+    assert 3 in cache and 4 not in cache
+
+
+def test_budget_evicts_least_recently_used() -> None:
+    build = Builder()
+    cache = FrameCache(build, max_bytes=2 * FRAME_BYTES)
+    cache[1]
+    cache[2]
+    cache[1]
+    cache[3]
+    assert 2 not in cache
+    assert 1 in cache and 3 in cache
+    assert cache.nbytes <= 2 * FRAME_BYTES
+
+
+def test_newest_frame_survives_tiny_budget() -> None:
+    cache = FrameCache(Builder(), max_bytes=1)
+    cache[5]
+    cache[6]
+    assert len(cache) == 1 and 6 in cache
+
+
+def test_clear_and_footprint() -> None:
+    cache = FrameCache(Builder())
+    empty = cache.memory_footprint()
+    cache[1]
+    assert cache.memory_footprint() >= empty + FRAME_BYTES
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_invalid_budget() -> None:
+    with pytest.raises(ValueError):
+        FrameCache(Builder(), max_bytes=0)
+
+
+def test_modes_draw_the_same_frames() -> None:
+    gradient = Gradient(
+        color(sRGB(255, 0, 0), sRGB(0, 0, 0)), color(sRGB(0, 0, 255), sRGB(9, 9, 9))
+    )
+    eager = BarBackend(gradient, 12, frame_cache="eager")
+    frames = [eager.frame(i) for i in range(eager.bins + 1)]
+    for mode in ("lazy", "compose"):
+        other = BarBackend(gradient, 12, frame_cache=mode, cache_budget=4096)
+        assert [other.frame(i) for i in range(other.bins + 1)] == frames
+
+
+def test_unknown_mode() -> None:
+    white = color(sRGB(255, 255, 255))
+    with pytest.raises(ValueError):
+        BarBackend(white, frame_cache="bogus")  # type: ignore[arg-type]
+
+
+def test_strategy() -> None:
+    assert choose_frame_cache(400, 100, expected_frames=401) == "compose"
+    assert choose_frame_cache(400, 100, memory_budget=1 << 20) == "eager"
+    assert choose_frame_cache(400, 100, memory_budget=1000) == "lazy"
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules whose import cost a short-lived CLI should never pay up front.
+HEAVY = ("numpy", "threading", "multiprocessing", "asyncio")
+
+
+def loaded_after(statement: str, modules: tuple[str, ...]) -> list[str]:
+    # ``-S`` keeps site from importing threading on our behalf.
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-S",
+            "-c",
+            f"import sys; {statement}; "
+            f"print(' '.join(m for m in {modules!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return completed.stdout.split()
+
+
+@pytest.mark.parametrize("package", ["src.bars", "src.colors"])
+def test_package_import_is_lazy(package: str) -> None:
+    assert loaded_after(f"import {package}", HEAVY) == []
+
+
+def test_lazy_export_loads_on_access() -> None:
+    assert loaded_after(
+        "from src.bars import MultiBar", ("src.bars.multi_bar", "asyncio")
+    ) == ["src.bars.multi_bar"]
+
+
+def test_fast_bar_defers_colors() -> None:
+    # The default colors are built on first use, not when the bar is imported.
+    assert loaded_after("import src.bars.fast_bar", ("src.colors",)) == []
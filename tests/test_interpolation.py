@@ -0,0 +1,101 @@
+import math
+import random
+
+import pytest
+
+from src.colors import color_array
+from src.colors.color_array import ColorArray
+from src.colors.gradient import Gradient, GradientGenerator
+from src.colors.interpolation import (
+    InterpolationSpace,
+    check_space,
+    from_working,
+    mix,
+    prepare_stops,
+    to_working,
+)
+from src.colors.types import color
+from src.colors.types.color_spaces import sRGB
+
+SPACES: list[InterpolationSpace] = ["srgb", "linear", "oklab", "oklch"]
+PERCEPTUAL: list[InterpolationSpace] = ["linear", "oklab", "oklch"]
+
+rng = random.Random(3)
+SAMPLES = [(v, v, v) for v in range(256)] + [
+    (rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(500)
+]
+
+
+@pytest.mark.parametrize("space", PERCEPTUAL)
+def test_encode_table_round_trips_every_byte(space: InterpolationSpace) -> None:
+    for rgb in SAMPLES:
+        assert from_working(space, to_working(space, rgb)) == rgb
+
+
+@pytest.mark.parametrize("space", PERCEPTUAL)
+def test_mix_endpoints_are_the_stops(space: InterpolationSpace) -> None:
+    for left, right in zip(SAMPLES[::2], SAMPLES[1::2], strict=True):
+        a, b = prepare_stops(space, [left, right])
+        assert mix(space, a, b, 0.0) == left
+        assert mix(space, a, b, 1.0) == right
+
+
+@pytest.mark.parametrize("space", SPACES)
+def test_gradient_endpoints(space: InterpolationSpace) -> None:
+    first = color(sRGB(255, 0, 0), sRGB(0, 0, 0))
+    last = color(sRGB(0, 0, 255), sRGB(255, 255, 255))
+    gradient = Gradient(first, last, space=space)
+    colors = list(GradientGenerator(9, gradient))
+    assert colors[0] == first
+    assert colors[-1] == last
+    assert gradient.get_color_at(0.0) == first
+    assert gradient.get_color_at(1.0) == last
+
+
+def test_oklab_midpoint_is_perceptual_gray() -> None:
+    black = to_working("oklab", (0, 0, 0))
+    white = to_working("oklab", (255, 255, 255))
+    # Oklab L = 0.5 is #636363, darker than the byte midpoint.
+    assert mix("oklab", black, white, 0.5) == (99, 99, 99)
+
+
+def test_oklch_takes_the_shorter_arc() -> None:
+    # Green and blue hues sit on either side of atan2's +-pi seam.
+    coords = prepare_stops("oklch", [(0, 255, 0), (0, 0, 255)])
+    assert abs(coords[1][2] - coords[0][2]) <= math.pi
+    gradient = Gradient(color(sRGB(0, 255, 0)), color(sRGB(0, 0, 255)), space="oklch")
+    # Through cyan, never through red and magenta.
+    assert all(c.foreground.red == 0 for c in GradientGenerator(7, gradient))
+
+
+def test_oklch_gray_borrows_neighbour_hue() -> None:
+    coords = prepare_stops("oklch", [(255, 255, 255), (255, 0, 0), (128, 128, 128)])
+    red_hue = coords[1][2]
+    assert coords[0][2] == red_hue
+    assert coords[2][2] == red_hue
+
+
+@pytest.mark.parametrize("batch", ["python", "numpy"])
+@pytest.mark.parametrize("space", SPACES)
+def test_color_array_matches_generator(
+    space: InterpolationSpace, batch: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if batch == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(color_array, "NUMPY_MIN_ROWS", 0)
+    else:
+        monkeypatch.setattr(color_array, "_numpy", lambda: None)
+    stops = [
+        color(sRGB(255, 0, 0), sRGB(0, 0, 0)),
+        color(sRGB(128, 128, 128), sRGB(10, 200, 30)),
+        color(sRGB(0, 40, 255), sRGB(255, 255, 255)),
+    ]
+    gradient = Gradient(*stops, positions=[0.0, 0.3, 1.0], space=space)
+    assert list(ColorArray.gradient(gradient, 50)) == list(
+        GradientGenerator(50, gradient)
+    )
+
+
+def test_unknown_space() -> None:
+    with pytest.raises(ValueError):
+        check_space("hsl")
@@ -0,0 +1,74 @@
+import pytest
+
+from src.bars import refresh
+from src.bars.refresh import RefreshPolicy
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.reads = 0
+
+    def __call__(self) -> float:
+        self.reads += 1
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(refresh, "monotonic", fake)
+    return fake
+
+
+def test_clock_not_read_before_next_check(clock: Clock) -> None:
+    policy = RefreshPolicy(miniters=5)
+    reads = clock.reads
+    assert not any(policy.should_refresh(i) for i in range(5))
+    assert clock.reads == reads
+
+
+def test_stride_follows_rate(clock: Clock) -> None:
+    policy = RefreshPolicy(max_fps=10)
+    clock.now += 0.5
+    policy.refreshed(500)
+    # 1000 it/s and a 0.1 s interval: check again 100 iterations later.
+    assert policy.next_check == 600
+
+
+def test_stride_is_clamped(clock: Clock) -> None:
+    policy = RefreshPolicy(max_fps=10, miniters=2, maxiters=50)
+    clock.now += 0.001
+    policy.refreshed(1000)
+    assert policy.next_check == 1050
+    clock.now += 10.0
+    policy.refreshed(1001)
+    assert policy.next_check == 1003
+
+
+def test_early_check_skips_ahead(clock: Clock) -> None:
+    policy = RefreshPolicy(max_fps=4)
+    clock.now += 0.125
+    assert not policy.should_refresh(100)
+    # Half the interval took 100 iterations, so 100 more fit in the rest.
+    assert policy.next_check == 200
+    clock.now += 0.125
+    assert policy.should_refresh(200)
+
+
+def test_overhead_stretches_interval(clock: Clock) -> None:
+    policy = RefreshPolicy(max_fps=10, overhead=0.01)
+    clock.now += 1.0
+    policy.refreshed(10, cost=0.02)
+    assert policy.interval == pytest.approx(2.0)
+    policy.refreshed(20, cost=0.0)
+    assert policy.interval == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_fps": 0}, {"overhead": 1.0}, {"miniters": 0}, {"maxiters": 0}],
+)
+def test_invalid_arguments(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        RefreshPolicy(**kwargs)  # type: ignore[arg-type]